@@ -112,9 +112,12 @@ def generable(description: Optional[str] = None):
     """
 
     def decorator(cls) -> type[Generable]:
-        # Convert to dataclass if not already
+        # Convert to dataclass if not already. slots=True lays the fields out
+        # as fixed offsets instead of a per-instance __dict__, which shrinks
+        # every generated instance and speeds up attribute access; classes the
+        # user already decorated with @dataclass keep their original layout.
         if not hasattr(cls, "__dataclass_fields__"):
-            cls = dataclass(cls)
+            cls = dataclass(cls, slots=True)
 
         # Store generable metadata.
         # We need _generable as an alternative to protocols for certain dynamic type scenarios.
@@ -142,6 +145,29 @@ def generable(description: Optional[str] = None):
 # MARK: - Schema Helpers
 
 
+def _resolved_type_hints(cls) -> dict:
+    """Return the class's fully-resolved type hints, cached on the class.
+
+    ``get_type_hints`` re-evaluates every string annotation against the
+    defining module's globals on each call, which gets expensive for classes
+    with forward references (``list["Person"]``) that are introspected
+    repeatedly — once per schema materialization and once per generated
+    instance. This resolves the hints a single time (normally at decoration
+    time, via :func:`create_partially_generated`) and caches the result in
+    ``cls.__fm_type_hints__``.
+
+    The cache is looked up via ``cls.__dict__`` so subclasses don't
+    accidentally reuse a parent's hints.
+    """
+    hints = cls.__dict__.get("__fm_type_hints__")
+    if hints is None:
+        hints = get_type_hints(
+            cls, localns={cls.__name__: cls}, include_extras=True
+        )  # Namespace annotation needed for self-referential types
+        cls.__fm_type_hints__ = hints
+    return hints
+
+
 def resolve_referenced_generables(
     field_type, outer_class_name: str
 ) -> Optional[List[GenerationSchema]]:
@@ -202,16 +228,25 @@ def generation_schema(cls_inner, description: Optional[str] = None) -> Generatio
         added by the generable decorator. Users don't usually need to call
         this directly.
 
+        The schema is materialized once per class and cached in
+        ``cls.__fm_schema__``; repeated calls — including the recursive
+        walks that nested generables trigger through
+        :func:`resolve_referenced_generables` — return the cached object.
+        Passing an explicit ``description`` bypasses the cache.
+
     .. seealso::
         :func:`generable` decorator which adds this as a class method.
         :class:`GenerationSchema` for the schema representation.
     """
+    if description is None:
+        cached = cls_inner.__dict__.get("__fm_schema__")
+        if cached is not None:
+            return cached
+
     properties = []
     referenced_schemas: list[GenerationSchema] = []
     referenced_schema_names: set[str] = set()
-    type_hints = get_type_hints(
-        cls_inner, localns={cls_inner.__name__: cls_inner}, include_extras=True
-    )  # Namespace annotation needed for self-referential types
+    type_hints = _resolved_type_hints(cls_inner)
 
     for field_name, field_info in cls_inner.__dataclass_fields__.items():
         field_type = type_hints.get(field_name, str)
@@ -240,12 +275,15 @@ def generation_schema(cls_inner, description: Optional[str] = None) -> Generatio
         )
         properties.append(prop)
 
-    return GenerationSchema(
+    schema = GenerationSchema(
         type_class=cls_inner,
         description=description,
         properties=properties,
         dynamic_nested_types=referenced_schemas,
     )
+    if description is None:
+        cls_inner.__fm_schema__ = schema
+    return schema
 
 
 # MARK: - GeneratedContent Helpers
@@ -255,7 +293,7 @@ def generation_schema(cls_inner, description: Optional[str] = None) -> Generatio
 def _from_generated_content(cls_inner, content: GeneratedContent):
     """Create instance from GeneratedContent."""
     kwargs = {}
-    type_hints = get_type_hints(cls_inner)
+    type_hints = _resolved_type_hints(cls_inner)
 
     for field_name in cls_inner.__dataclass_fields__:
         try:
@@ -287,9 +325,10 @@ def generated_content(self) -> GeneratedContent:
 def partial_from_generated_content(cls, partial_cls, content: GeneratedContent):
     """Create partial instance from GeneratedContent."""
     kwargs: dict = {"id": content.id}
+    type_hints = _resolved_type_hints(cls)
     for field_name in cls.__dataclass_fields__:
         try:
-            field_type = get_type_hints(cls)[field_name]
+            field_type = type_hints[field_name]
             value = content.value(field_type, for_property=field_name)
             kwargs[field_name] = value
         except Exception as e:
@@ -303,9 +342,7 @@ def create_partially_generated(cls) -> Type:
     # Create PartiallyGenerated inner class
     partial_fields = {}
     partial_annotations = {}
-    type_hints = get_type_hints(
-        cls, localns={cls.__name__: cls}
-    )  # Namespace annotation needed for self-referential types
+    type_hints = _resolved_type_hints(cls)
 
     for field_name, field_info in cls.__dataclass_fields__.items():
         field_type = type_hints.get(field_name, str)
@@ -4,6 +4,7 @@
 import asyncio
 import json
 import logging
+from functools import cached_property
 from apple_fm_sdk.transcript import Transcript
 from .c_helpers import (
     _ManagedObject,
@@ -160,14 +161,23 @@ class LanguageModelSession(_ManagedObject):
                 model_ptr, instructions_cstr, tool_refs, tool_count
             )
 
-            # Create transcript
-            self.transcript = Transcript(ptr)
-
             # model object will be retained by LanguageModelSession in Swift
             # so here we don't need to retain model
             super().__init__(ptr)
         # This opaque pointer already has 1 ref count by `passRetained`
 
+    @cached_property
+    def transcript(self) -> Transcript:
+        """The session history as a :class:`~apple_fm_sdk.transcript.Transcript`.
+
+        Built lazily on first access and cached for the lifetime of the
+        session, so repeated accesses return the same wrapper instead of
+        allocating a new one. The wrapper borrows the session's pointer and
+        therefore stays valid exactly as long as the session does; the cache
+        lives in the instance ``__dict__`` and is released with it.
+        """
+        return Transcript(self._ptr)
+
     @property
     def is_responding(self) -> bool:
         """Check if the session is currently responding to a request.
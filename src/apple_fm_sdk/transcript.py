@@ -1,9 +1,16 @@
 # For licensing see accompanying LICENSE file.
 # Copyright (C) 2026 Apple Inc. All Rights Reserved.
 
-import json
 import ctypes
 
+# orjson parses UTF-8 bytes in C without an intermediate Python string; it
+# is an optional accelerator, so fall back to the stdlib parser (which also
+# accepts bytes) when it is not installed.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from apple_fm_sdk.errors import _status_code_to_exception
 from apple_fm_sdk.c_helpers import _get_error_string
 
@@ -159,6 +166,72 @@ class Transcript:
         # A transcript doesn't get it's own pointer, it uses the session's pointer
         self.session_ptr = _ptr
 
+    def _fetch_json_bytes(self) -> bytes:
+        """Fetch the transcript from the Swift bridge as raw UTF-8 JSON bytes.
+
+        Shared by :meth:`to_dict` and :meth:`to_json_bytes`; performs the
+        bridge call and error translation but no parsing.
+        """
+        error_code = ctypes.c_int32()  # C error status code
+        error_description = ctypes.POINTER(
+            ctypes.c_char
+        )()  # C error description pointer
+        jsn_string = lib.FMLanguageModelSessionGetTranscriptJSONString(
+            self.session_ptr, ctypes.byref(error_code), ctypes.byref(error_description)
+        )
+
+        # Check if we got a valid result or an error
+        if jsn_string is None or (
+            hasattr(jsn_string, "data") and jsn_string.data is None
+        ):
+            # An error occurred, raise appropriate exception
+            err_code, err_desc = _get_error_string(error_code, error_description)
+            error_msg = "Failed to fetch session transcript"
+            if err_desc:
+                error_msg = error_msg + ": " + err_desc
+            raise _status_code_to_exception(err_code or error_code.value, error_msg)
+
+        # Successfully got the JSON string
+        # The return value is wrapped in a String object by ctypes
+        # The String wrapper handles memory, so we don't need to manually free
+        #
+        # Read the buffer as bytes: str(jsn_string) would decode the whole
+        # transcript into an extra Python string that callers may never need.
+        if hasattr(jsn_string, "data"):
+            return ctypes.string_at(jsn_string.data)
+        return jsn_string
+
+    async def to_json_bytes(self) -> bytes:
+        """Get the current transcript of the session as raw UTF-8 JSON bytes.
+
+        This is the fast path for callers that don't need a Python dictionary:
+        it performs the same bridge call as :meth:`to_dict` but skips the JSON
+        parse entirely, which for large transcripts is the bulk of the cost.
+        Useful for writing the transcript straight to a file or socket, or for
+        tests that only need to check that a transcript exists.
+
+        :return: The transcript as UTF-8 encoded JSON bytes
+        :rtype: bytes
+        :raises GenerationError: If fetching the transcript fails due to an internal error
+
+        Example:
+            ::
+
+                import apple_fm_sdk as fm
+
+                session = fm.LanguageModelSession()
+                await session.respond("Hello!")
+
+                raw = await session.transcript.to_json_bytes()
+                with open("session.json", "wb") as f:
+                    f.write(raw)
+
+        Note:
+            - This is an async function and must be awaited
+            - Use :meth:`to_dict` when you need to inspect the entries
+        """
+        return self._fetch_json_bytes()
+
     async def to_dict(self) -> dict:
         """Get the current transcript of the session as a dictionary.
 
@@ -200,28 +273,4 @@ class Transcript:
             - The returned dictionary is a snapshot; it won't update automatically
             - Call this function again to get an updated transcript after new interactions
         """
-        error_code = ctypes.c_int32()  # C error status code
-        error_description = ctypes.POINTER(
-            ctypes.c_char
-        )()  # C error description pointer
-        jsn_string = lib.FMLanguageModelSessionGetTranscriptJSONString(
-            self.session_ptr, ctypes.byref(error_code), ctypes.byref(error_description)
-        )
-
-        # Check if we got a valid result or an error
-        if jsn_string is None or (
-            hasattr(jsn_string, "data") and jsn_string.data is None
-        ):
-            # An error occurred, raise appropriate exception
-            err_code, err_desc = _get_error_string(error_code, error_description)
-            error_msg = "Failed to fetch session transcript"
-            if err_desc:
-                error_msg = error_msg + ": " + err_desc
-            raise _status_code_to_exception(err_code or error_code.value, error_msg)
-
-        # Successfully got the JSON string, parse it and free the C string
-        # The return value is wrapped in a String object by ctypes
-        # The String wrapper handles memory, so we don't need to manually free
-        json_str = str(jsn_string)
-        result = json.loads(json_str)
-        return result
+        return _json.loads(self._fetch_json_bytes())
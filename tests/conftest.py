@@ -12,6 +12,7 @@ import asyncio
 import gc
 import warnings
 import pytest
+import pytest_asyncio
 import apple_fm_sdk as fm
 
 
@@ -27,6 +28,11 @@ def pytest_collection_modifyitems(config, items):
     Hook to reorder tests so that tests in 'tests/' run before 'tests/doc_tests/'.
 
     This ensures that core functionality tests run first, followed by documentation tests.
+
+    It also marks the transcript tests as skipped at collection time when no
+    model is available: every one of them needs a working model, so skipping
+    here avoids spinning up the async machinery (and the session-scoped model
+    fixture) just to skip each test during setup.
     """
     # Separate tests into two groups
     main_tests = []
@@ -43,6 +49,14 @@ def pytest_collection_modifyitems(config, items):
     # Reorder: main tests first, then doc tests
     items[:] = main_tests + doc_tests
 
+    if not _MODEL_IS_AVAILABLE:
+        skip_no_model = pytest.mark.skip(
+            reason=f"Model not available: {_MODEL_UNAVAILABLE_REASON}"
+        )
+        for item in items:
+            if "test_transcript" in str(item.fspath):
+                item.add_marker(skip_no_model)
+
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -161,6 +175,56 @@ def event_loop(request):
         pass
 
 
+# Probed once when conftest is imported, so model-dependent tests can skip at
+# collection time instead of constructing a model and probing per test
+_MODEL_IS_AVAILABLE, _MODEL_UNAVAILABLE_REASON = fm.SystemLanguageModel().is_available()
+
+requires_model = pytest.mark.skipif(
+    not _MODEL_IS_AVAILABLE,
+    reason=f"No model available: {_MODEL_UNAVAILABLE_REASON}",
+)
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session", autouse=True)
+async def check_for_leaked_tasks():
+    """Warn about tasks still pending when the shared event loop winds down.
+
+    With one loop serving the whole run (asyncio_default_test_loop_scope =
+    "session"), a task leaked by one test survives into every later test
+    instead of dying with a per-test loop — so surface any leftovers here.
+    """
+    yield
+
+    pending = [
+        task
+        for task in asyncio.all_tasks()
+        if task is not asyncio.current_task() and not task.done()
+    ]
+    if pending:
+        warnings.warn(
+            f"{len(pending)} asyncio task(s) still pending at end of session: "
+            f"{pending}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Event loop policy used by pytest-asyncio for every async test.
+
+    When uvloop happens to be installed, its C event loop lowers the
+    per-await scheduling overhead across the whole suite. It is not a
+    declared dependency (and does not support Windows), so fall back to
+    the interpreter's default policy when the import fails.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def model():
     """Shared fixture for system language model."""
@@ -171,6 +235,40 @@ def model():
     return model
 
 
+@pytest.fixture(scope="session")
+def available_model():
+    """Session-scoped system language model, availability-checked once.
+
+    Model construction and the availability probe both cross the native
+    bridge and are identical for every test, so this fixture amortizes
+    them across the whole test session. Use this in tests that only need
+    a ready-to-use default model; use the function-scoped ``model``
+    fixture when a test must exercise model construction itself.
+    """
+    model = fm.SystemLanguageModel()
+    is_available, reason = model.is_available()
+    if not is_available:
+        pytest.skip(f"Model not available: {reason}")
+    return model
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def warm_model(available_model):
+    """Session-scoped model with the on-device runtime already warmed up.
+
+    The first ``respond()`` in a process pays a one-time model load cost that
+    dominates the wall time of whichever test happens to run first. This
+    fixture issues a single throwaway respond so the weights are resident
+    before any dependent test measures or waits on its own first request.
+    Use it in place of ``available_model`` in tests that call ``respond()``.
+    """
+    session = fm.LanguageModelSession(model=available_model)
+    await session.respond("warmup")
+    del session
+    gc.collect()
+    return available_model
+
+
 @pytest.fixture
 def session(model):
     """Shared fixture for language model session."""
@@ -16,23 +16,48 @@ This test suite provides comprehensive coverage of:
 import asyncio
 import gc
 import weakref
+from contextlib import aclosing
 import apple_fm_sdk as fm
 import pytest
 from tester_tools.tester_tools import SimpleCalculatorTool
 
 
+async def _drain_refs(refs, timeout=0.3):
+    """Run one collection, then wait for the given weak references to clear.
+
+    A single ``gc.collect()`` is enough to break cycles once the strong
+    references are gone. After that, poll the weakrefs with exponential
+    backoff instead of sleeping for a fixed interval, so tests only wait
+    as long as the native deallocators actually need.
+
+    ``refs`` may be a ``weakref.WeakSet`` (emptied automatically as its
+    members are collected) or an iterable of ``weakref.ref`` objects.
+    """
+    delay = 0.005
+    waited = 0.0
+    while True:
+        gc.collect()
+        await asyncio.sleep(0)  # Let any queued finalizers run
+        if isinstance(refs, weakref.WeakSet):
+            cleared = len(refs) == 0
+        else:
+            cleared = all(ref() is None for ref in refs)
+        if cleared:
+            return
+        if waited >= timeout:
+            return
+        await asyncio.sleep(delay)
+        waited += delay
+        delay *= 2
+
+
 @pytest.mark.asyncio
-async def test_timeout_handling():
+async def test_timeout_handling(available_model):
     """Demonstrate timeout handling for long-running requests."""
     print("\n=== Timeout Handling ===")
 
     # Get the default model
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Test with a very short timeout
     print("Testing with 0.1 second timeout (should timeout)...")
@@ -92,17 +117,12 @@ async def test_memory_management():
 
 
 @pytest.mark.asyncio
-async def test_session_deallocation():
+async def test_session_deallocation(available_model):
     """Verify that sessions are actually deallocated using weakref."""
     print("\n=== Testing Session Deallocation ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     # Create session and weak reference
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
     weak_session = weakref.ref(session)
 
     # Use session
@@ -192,20 +212,15 @@ async def test_tool_deallocation():
 
 
 @pytest.mark.asyncio
-async def test_multiple_sessions_deallocation():
+async def test_multiple_sessions_deallocation(available_model):
     """Verify multiple sessions are all deallocated."""
     print("\n=== Testing Multiple Sessions Deallocation ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     weak_refs = []
 
     # Create multiple sessions
     for i in range(5):
-        session = fm.LanguageModelSession(model=model)
+        session = fm.LanguageModelSession(model=available_model)
         weak_refs.append(weakref.ref(session))
         response = await session.respond(f"Count to {i + 1}")
         assert response, f"Expected response for session {i}"
@@ -218,7 +233,9 @@ async def test_multiple_sessions_deallocation():
     await asyncio.sleep(0.2)
 
     # Verify all sessions deallocated
-    leaked_count = sum(1 for ref in weak_refs if ref() is not None)
+    # Bool arithmetic rather than a filtered generator: no per-element branch,
+    # same count (True == 1)
+    leaked_count = sum(ref() is not None for ref in weak_refs)
     assert leaked_count == 0, f"{leaked_count} sessions not deallocated - memory leak!"
     print(f"✓ All {len(weak_refs)} sessions properly deallocated")
 
@@ -229,16 +246,11 @@ async def test_multiple_sessions_deallocation():
 
 
 @pytest.mark.asyncio
-async def test_concurrent_requests_queued():
+async def test_concurrent_requests_queued(available_model):
     """Test that concurrent requests to same session are queued and processed sequentially."""
     print("\n=== Testing Concurrent Requests Queuing ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Track completion order
     completion_order = []
@@ -284,17 +296,12 @@ async def test_concurrent_requests_queued():
 
 
 @pytest.mark.asyncio
-async def test_multiple_sessions_concurrent():
+async def test_multiple_sessions_concurrent(available_model):
     """Test multiple sessions can run concurrently."""
     print("\n=== Testing Multiple Sessions Concurrent ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     # Create multiple sessions
-    sessions = [fm.LanguageModelSession(model=model) for _ in range(3)]
+    sessions = [fm.LanguageModelSession(model=available_model) for _ in range(3)]
 
     # Run requests concurrently across different sessions
     tasks = [
@@ -318,16 +325,11 @@ async def test_multiple_sessions_concurrent():
 
 
 @pytest.mark.asyncio
-async def test_sequential_requests_same_session():
+async def test_sequential_requests_same_session(available_model):
     """Test sequential requests to same session work correctly."""
     print("\n=== Testing Sequential Requests Same Session ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Make multiple sequential requests
     for i in range(3):
@@ -344,16 +346,11 @@ async def test_sequential_requests_same_session():
 
 
 @pytest.mark.asyncio
-async def test_error_path_cleanup_invalid_prompt():
+async def test_error_path_cleanup_invalid_prompt(available_model):
     """Verify cleanup when invalid prompt causes error."""
     print("\n=== Testing Error Path Cleanup (Invalid Prompt) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Try to send empty prompt (may cause error)
     try:
@@ -368,16 +365,11 @@ async def test_error_path_cleanup_invalid_prompt():
 
 
 @pytest.mark.asyncio
-async def test_error_path_cleanup_cancelled_request():
+async def test_error_path_cleanup_cancelled_request(available_model):
     """Verify cleanup when request is cancelled."""
     print("\n=== Testing Error Path Cleanup (Cancelled Request) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Start request and cancel it
     task = asyncio.create_task(
@@ -404,16 +396,11 @@ async def test_error_path_cleanup_cancelled_request():
 
 
 @pytest.mark.asyncio
-async def test_error_path_cleanup_with_schema():
+async def test_error_path_cleanup_with_schema(available_model):
     """Verify cleanup when structured generation encounters error."""
     print("\n=== Testing Error Path Cleanup (With Schema) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Create a simple schema
     @fm.generable()
@@ -436,16 +423,11 @@ async def test_error_path_cleanup_with_schema():
 
 
 @pytest.mark.asyncio
-async def test_error_path_multiple_cancellations():
+async def test_error_path_multiple_cancellations(available_model):
     """Test multiple cancellations don't cause issues."""
     print("\n=== Testing Multiple Cancellations ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Cancel multiple requests
     for i in range(3):
@@ -480,16 +462,11 @@ async def test_error_path_multiple_cancellations():
 
 
 @pytest.mark.asyncio
-async def test_long_running_session_many_requests():
+async def test_long_running_session_many_requests(available_model):
     """Test session with many sequential requests."""
     print("\n=== Testing Long-Running Session (Many Requests) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Make many requests to same session
     num_requests = 20
@@ -503,17 +480,12 @@ async def test_long_running_session_many_requests():
 
 
 @pytest.mark.asyncio
-async def test_long_running_session_with_tools():
+async def test_long_running_session_with_tools(available_model):
     """Test long-running session with tool calls."""
     print("\n=== Testing Long-Running Session with Tools ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     tool = SimpleCalculatorTool()
-    session = fm.LanguageModelSession(model=model, tools=[tool])
+    session = fm.LanguageModelSession(model=available_model, tools=[tool])
 
     # Make multiple requests that might use tools
     num_requests = 10
@@ -527,16 +499,11 @@ async def test_long_running_session_with_tools():
 
 
 @pytest.mark.asyncio
-async def test_long_running_session_mixed_operations():
+async def test_long_running_session_mixed_operations(available_model):
     """Test session with mixed operations (respond, stream, schema)."""
     print("\n=== Testing Long-Running Session (Mixed Operations) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Mix different types of operations
     operations = [
@@ -567,69 +534,79 @@ async def test_long_running_session_mixed_operations():
 # =============================================================================
 
 
+@fm.generable()
+class MemoryTrackerArgs:
+    value: int
+
+
 @pytest.mark.asyncio
 async def test_tool_callback_memory():
     """Test tool callback memory management."""
     print("\n=== Testing Tool Callback Memory ===")
 
-    call_count = {"count": 0}
-    weak_refs = []
+    # Single-subscript counter: no per-call string hashing like a dict entry
+    call_count = [0]
+    # WeakSet drops entries automatically as referents are collected, so the
+    # leak count is just len() — no per-ref allocation or O(N) sweep needed
+    weak_refs = weakref.WeakSet()
 
     class MemoryTrackingTool(fm.Tool):
         name = "memory_tracker"
         description = "Track memory in tool callbacks"
+        _schema = None
 
         @property
         def arguments_schema(self) -> fm.GenerationSchema:
-            @fm.generable()
-            class Args:
-                value: int
-
-            return Args.generation_schema()
+            # Built lazily and cached on the class; defining the generable
+            # argument class inside the property would re-run the decorator
+            # and rebuild the schema on every access
+            if MemoryTrackingTool._schema is None:
+                MemoryTrackingTool._schema = MemoryTrackerArgs.generation_schema()
+            return MemoryTrackingTool._schema
 
         async def call(self, args: fm.GeneratedContent) -> str:
-            call_count["count"] += 1
+            call_count[0] += 1
             # Track the GeneratedContent object
-            weak_refs.append(weakref.ref(args))
+            weak_refs.add(args)
             value = args.value(int, for_property="value")
             return f"Processed: {value}"
 
     tool = MemoryTrackingTool()
 
-    # Call tool multiple times
+    # Call tool multiple times. Reuse one payload dict so the leak check
+    # exercises GeneratedContent allocation, not dict allocation. This is
+    # safe because each args object is created, used and dropped within the
+    # iteration: the native content snapshots the payload at construction,
+    # and GeneratedContent keeps the dict by reference rather than copying.
+    payload = {"value": 0}
     for i in range(5):
-        args = fm.GeneratedContent(content_dict={"value": i})
+        payload["value"] = i
+        args = fm.GeneratedContent(content_dict=payload)
         result = await tool.call(args)
         assert f"Processed: {i}" in result, f"Unexpected result: {result}"
         del args
 
-    print(f"✓ Tool called {call_count['count']} times")
+    print(f"✓ Tool called {call_count[0]} times")
 
     # Force cleanup
-    gc.collect()
-    gc.collect()
-    await asyncio.sleep(0.1)
+    await _drain_refs(weak_refs)
 
     # Check if GeneratedContent objects were deallocated
-    leaked = sum(1 for ref in weak_refs if ref() is not None)
-    assert leaked == 0, f"{leaked} GeneratedContent objects not deallocated!"
+    assert len(weak_refs) == 0, (
+        f"{len(weak_refs)} GeneratedContent objects not deallocated!"
+    )
     print("✓ All GeneratedContent objects properly deallocated")
 
 
 @pytest.mark.asyncio
-async def test_tool_with_session_memory():
+async def test_tool_with_session_memory(available_model):
     """Test tool memory when used with session."""
     print("\n=== Testing Tool with Session Memory ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     tool = SimpleCalculatorTool()
     weak_tool = weakref.ref(tool)
 
-    session = fm.LanguageModelSession(model=model, tools=[tool])
+    session = fm.LanguageModelSession(model=available_model, tools=[tool])
     weak_session = weakref.ref(session)
 
     # Use session with tool
@@ -640,9 +617,7 @@ async def test_tool_with_session_memory():
     # Delete and verify cleanup
     del session
     del tool
-    gc.collect()
-    gc.collect()
-    await asyncio.sleep(0.2)
+    await _drain_refs([weak_session, weak_tool])
 
     assert weak_session() is None, "Session not deallocated!"
     assert weak_tool() is None, "Tool not deallocated!"
@@ -650,20 +625,16 @@ async def test_tool_with_session_memory():
 
 
 @pytest.mark.asyncio
-async def test_multiple_tools_memory():
+async def test_multiple_tools_memory(available_model):
     """Test memory management with multiple tools."""
     print("\n=== Testing Multiple Tools Memory ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
     # Create multiple tools
     tools = [SimpleCalculatorTool() for _ in range(5)]
-    weak_refs = [weakref.ref(tool) for tool in tools]
+    tool_count = len(tools)
+    weak_refs = weakref.WeakSet(tools)
 
-    session = fm.LanguageModelSession(model=model, tools=[*tools])
+    session = fm.LanguageModelSession(model=available_model, tools=[*tools])
 
     # Use session
     response = await session.respond("What is 2+2?")
@@ -673,13 +644,10 @@ async def test_multiple_tools_memory():
     # Delete and verify cleanup
     del session
     del tools
-    gc.collect()
-    gc.collect()
-    await asyncio.sleep(0.2)
+    await _drain_refs(weak_refs)
 
-    leaked = sum(1 for ref in weak_refs if ref() is not None)
-    assert leaked == 0, f"{leaked} tools not deallocated!"
-    print(f"✓ All {len(weak_refs)} tools properly deallocated")
+    assert len(weak_refs) == 0, f"{len(weak_refs)} tools not deallocated!"
+    print(f"✓ All {tool_count} tools properly deallocated")
 
 
 # =============================================================================
@@ -688,21 +656,17 @@ async def test_multiple_tools_memory():
 
 
 @pytest.mark.asyncio
-async def test_stream_cleanup_normal():
+async def test_stream_cleanup_normal(available_model):
     """Test stream cleanup after normal completion."""
     print("\n=== Testing Stream Cleanup (Normal) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Stream response
     chunks = []
-    async for chunk in session.stream_response("Count to 5"):
-        chunks.append(chunk)
+    async with aclosing(session.stream_response("Count to 5")) as stream:
+        async for chunk in stream:
+            chunks.append(chunk)
 
     assert chunks, "Expected chunks from stream"
     print(f"✓ Stream completed with {len(chunks)} chunks")
@@ -714,29 +678,24 @@ async def test_stream_cleanup_normal():
 
 
 @pytest.mark.asyncio
-async def test_stream_cleanup_early_break():
+async def test_stream_cleanup_early_break(available_model):
     """Test stream cleanup when breaking early."""
     print("\n=== Testing Stream Cleanup (Early Break) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
-    # Stream response but break early
+    # Stream response but break early. aclosing() finalizes the generator
+    # synchronously on exit instead of leaving it queued on the event loop's
+    # deferred async-generator shutdown path.
     chunk_count = 0
-    async for chunk in session.stream_response("Write a long story"):
-        chunk_count += 1
-        if chunk_count >= 3:
-            break
+    async with aclosing(session.stream_response("Write a long story")) as stream:
+        async for chunk in stream:
+            chunk_count += 1
+            if chunk_count >= 3:
+                break
 
     print(f"✓ Stream broke early after {chunk_count} chunks")
 
-    # Wait for cleanup
-    await asyncio.sleep(0.2)
-
     # Verify session is still usable
     response = await session.respond("What is 2+2?")
     assert response, "Session should be usable after early break"
@@ -744,30 +703,23 @@ async def test_stream_cleanup_early_break():
 
 
 @pytest.mark.asyncio
-async def test_stream_cleanup_exception():
+async def test_stream_cleanup_exception(available_model):
     """Test stream cleanup when exception occurs."""
     print("\n=== Testing Stream Cleanup (Exception) ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Stream response and raise exception
     chunk_count = 0
     try:
-        async for chunk in session.stream_response("Count to 10"):
-            chunk_count += 1
-            if chunk_count >= 2:
-                raise ValueError("Test exception")
+        async with aclosing(session.stream_response("Count to 10")) as stream:
+            async for chunk in stream:
+                chunk_count += 1
+                if chunk_count >= 2:
+                    raise ValueError("Test exception")
     except ValueError:
         print(f"✓ Exception raised after {chunk_count} chunks")
 
-    # Wait for cleanup
-    await asyncio.sleep(0.2)
-
     # Verify session is still usable
     response = await session.respond("What is 2+2?")
     assert response, "Session should be usable after exception"
@@ -775,22 +727,18 @@ async def test_stream_cleanup_exception():
 
 
 @pytest.mark.asyncio
-async def test_multiple_streams_sequential():
+async def test_multiple_streams_sequential(available_model):
     """Test multiple sequential streams."""
     print("\n=== Testing Multiple Sequential Streams ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
 
     # Run multiple streams sequentially
     for i in range(3):
         chunks = []
-        async for chunk in session.stream_response(f"Count to {i + 1}"):
-            chunks.append(chunk)
+        async with aclosing(session.stream_response(f"Count to {i + 1}")) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
 
         assert chunks, f"Expected chunks from stream {i + 1}"
         print(f"✓ Stream {i + 1} completed with {len(chunks)} chunks")
@@ -799,31 +747,25 @@ async def test_multiple_streams_sequential():
 
 
 @pytest.mark.asyncio
-async def test_stream_session_deallocation():
+async def test_stream_session_deallocation(available_model):
     """Test session deallocation after streaming."""
     print("\n=== Testing Stream Session Deallocation ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    session = fm.LanguageModelSession(model=model)
+    session = fm.LanguageModelSession(model=available_model)
     weak_session = weakref.ref(session)
 
     # Stream response
     chunks = []
-    async for chunk in session.stream_response("Say hello"):
-        chunks.append(chunk)
+    async with aclosing(session.stream_response("Say hello")) as stream:
+        async for chunk in stream:
+            chunks.append(chunk)
 
     assert chunks, "Expected chunks from stream"
     print(f"✓ Stream completed with {len(chunks)} chunks")
 
     # Delete and verify cleanup
     del session
-    gc.collect()
-    gc.collect()
-    await asyncio.sleep(0.2)
+    await _drain_refs([weak_session])
 
     assert weak_session() is None, "Session not deallocated after streaming!"
     print("✓ Session properly deallocated after streaming")
@@ -835,24 +777,24 @@ async def test_stream_session_deallocation():
 
 
 @pytest.mark.asyncio
-async def test_comprehensive_memory_lifecycle():
+async def test_comprehensive_memory_lifecycle(available_model):
     """Comprehensive test of memory lifecycle across all operations."""
     print("\n=== Testing Comprehensive Memory Lifecycle ===")
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    weak_refs = {"sessions": [], "tools": [], "contents": []}
+    num_iterations = 3
+    weak_refs = {
+        "sessions": weakref.WeakSet(),
+        "tools": weakref.WeakSet(),
+        "contents": weakref.WeakSet(),
+    }
 
     # Create and use multiple sessions with various operations
-    for i in range(3):
+    for i in range(num_iterations):
         tool = SimpleCalculatorTool()
-        weak_refs["tools"].append(weakref.ref(tool))
+        weak_refs["tools"].add(tool)
 
-        session = fm.LanguageModelSession(model=model, tools=[tool])
-        weak_refs["sessions"].append(weakref.ref(session))
+        session = fm.LanguageModelSession(model=available_model, tools=[tool])
+        weak_refs["sessions"].add(session)
 
         # Regular respond
         response = await session.respond(f"What is {i + 1}?")
@@ -860,35 +802,53 @@ async def test_comprehensive_memory_lifecycle():
 
         # Stream
         chunks = []
-        async for chunk in session.stream_response(f"Count to {i + 1}"):
-            chunks.append(chunk)
+        async with aclosing(session.stream_response(f"Count to {i + 1}")) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
         assert chunks, f"Expected chunks {i + 1}"
 
         # Create content
         content = fm.GeneratedContent(content_dict={"value": i})
-        weak_refs["contents"].append(weakref.ref(content))
+        weak_refs["contents"].add(content)
         del content
 
-        print(f"✓ Lifecycle iteration {i + 1} completed")
-
         del session
         del tool
 
-    # Force cleanup
-    gc.collect()
-    gc.collect()
-    await asyncio.sleep(0.3)
+        # Mini-drain at the end of each iteration: a generation-0 collect plus
+        # one loop turn (so queued finalizers run) keeps per-iteration garbage
+        # from accumulating, and asserting here pins a leak to the iteration
+        # that introduced it rather than the end of the test.
+        gc.collect(0)
+        await asyncio.sleep(0)
+        if weak_refs["sessions"] or weak_refs["tools"] or weak_refs["contents"]:
+            # Objects that survived an automatic collection mid-iteration get
+            # promoted past generation 0; fall back to the full drain for them.
+            await _drain_refs(
+                weak_refs["sessions"] | weak_refs["tools"] | weak_refs["contents"]
+            )
+        assert len(weak_refs["sessions"]) == 0, f"Session leaked in iteration {i + 1}"
+        assert len(weak_refs["tools"]) == 0, f"Tool leaked in iteration {i + 1}"
+        assert len(weak_refs["contents"]) == 0, f"Content leaked in iteration {i + 1}"
 
-    # Verify all objects deallocated
-    leaked_sessions = sum(1 for ref in weak_refs["sessions"] if ref() is not None)
-    leaked_tools = sum(1 for ref in weak_refs["tools"] if ref() is not None)
-    leaked_contents = sum(1 for ref in weak_refs["contents"] if ref() is not None)
+        print(f"✓ Lifecycle iteration {i + 1} completed")
 
-    assert leaked_sessions == 0, f"{leaked_sessions} sessions leaked!"
-    assert leaked_tools == 0, f"{leaked_tools} tools leaked!"
-    assert leaked_contents == 0, f"{leaked_contents} contents leaked!"
+    # Final full collect as ground truth; each iteration already drained, so
+    # this should find nothing left to free.
+    await _drain_refs(
+        weak_refs["sessions"] | weak_refs["tools"] | weak_refs["contents"]
+    )
+
+    # Verify all objects deallocated
+    assert len(weak_refs["sessions"]) == 0, (
+        f"{len(weak_refs['sessions'])} sessions leaked!"
+    )
+    assert len(weak_refs["tools"]) == 0, f"{len(weak_refs['tools'])} tools leaked!"
+    assert len(weak_refs["contents"]) == 0, (
+        f"{len(weak_refs['contents'])} contents leaked!"
+    )
 
     print("✓ All objects properly deallocated in comprehensive test")
-    print(f"  - Sessions: {len(weak_refs['sessions'])} created, 0 leaked")
-    print(f"  - Tools: {len(weak_refs['tools'])} created, 0 leaked")
-    print(f"  - Contents: {len(weak_refs['contents'])} created, 0 leaked")
+    print(f"  - Sessions: {num_iterations} created, 0 leaked")
+    print(f"  - Tools: {num_iterations} created, 0 leaked")
+    print(f"  - Contents: {num_iterations} created, 0 leaked")
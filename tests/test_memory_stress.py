@@ -5,18 +5,24 @@
 Memory Stress Test for Foundation Models
 
 This test performs stress testing on the Foundation Models library to detect potential
-memory leaks and ensure proper resource cleanup. It creates and destroys 1000 language
-model sessions in sequence, monitoring memory usage throughout the process.
+memory leaks and ensure proper resource cleanup. It runs two independent phases so a
+regression in either lifecycle can be localized:
+
+- Session stress: one shared model, 1000 LanguageModelSession create/respond/destroy
+  cycles. This is the primary workload.
+- Model stress: 1000 SystemLanguageModel create/probe/destroy cycles, with no
+  session or inference involved.
 
 Key aspects tested:
 - Memory allocation and deallocation for LanguageModelSession objects
-- Proper cleanup of native resources when sessions are destroyed
-- Memory stability over many session creation/destruction cycles
+- Memory allocation and deallocation for SystemLanguageModel handles
+- Proper cleanup of native resources when objects are destroyed
+- Memory stability over many creation/destruction cycles
 - Garbage collection effectiveness with periodic forced collections
 
 The test tracks Resident Set Size (RSS) memory usage and prints periodic updates.
 A successful test indicates that memory usage remains stable and doesn't grow
-unboundedly, confirming that sessions are properly cleaned up and no memory leaks exist.
+unboundedly, confirming that objects are properly cleaned up and no memory leaks exist.
 
 Note: This is a standalone script (not a pytest test) that should be run directly
 to observe memory behavior over time.
@@ -27,15 +33,16 @@ import sys
 import os
 import apple_fm_sdk as fm
 import psutil
-import time
 import gc
+import tracemalloc
 
 proc = psutil.Process(os.getpid())
 
 # Configuration
 NUM_ITERATIONS = 1000
 GC_INTERVAL = 10
-MEMORY_LEAK_THRESHOLD_MB = 50  # Maximum acceptable memory growth in MB
+MEMORY_LEAK_THRESHOLD_MB = 50  # Maximum acceptable RSS growth in MB
+TRACED_LEAK_THRESHOLD_MB = 5  # Maximum acceptable Python-heap growth in MB
 PAUSE_BETWEEN_REQUESTS = 0.1  # seconds
 
 
@@ -51,42 +58,51 @@ def print_mem(tag):
 
 
 # Do not use pytest for this file
-async def memory_stress():
+async def _run_stress(name, iteration):
     """
-    Run memory stress test by creating many sessions.
+    Run one stress phase by invoking ``iteration`` NUM_ITERATIONS times.
+
+    Args:
+        name: Label used in memory reports for this phase
+        iteration: Async callable invoked with the 1-based iteration number
 
     Returns:
         tuple: (success: bool, initial_memory_mb: float, final_memory_mb: float, error_msg: str)
     """
-    print_mem("Start")
+    print_mem(f"{name} start")
 
-    # Force garbage collection and get baseline memory
+    # Force garbage collection and get baseline memory. Sleeping via asyncio
+    # keeps the event loop running so any queued finalizers make progress
+    # before each RSS sample; time.sleep() here would block them.
     gc.collect()
-    time.sleep(0.2)
+    await asyncio.sleep(0.2)
     initial_memory = get_memory_mb()
     print(f"Baseline memory after GC: {initial_memory:.2f} MB")
     print(f"Running {NUM_ITERATIONS} iterations...\n")
 
+    # tracemalloc diffs at Python-object granularity and attributes growth to
+    # allocation sites, so the primary leak check is insensitive to the
+    # allocator/arena fragmentation that inflates RSS. RSS is still reported
+    # and checked with its coarser threshold as a native-leak backstop.
+    tracemalloc.start(25)
+    baseline_snapshot = tracemalloc.take_snapshot()
+
+    # Exclude the interpreter's startup heap from every periodic scan below;
+    # objects alive at this point are not what the stress test is measuring.
+    gc.freeze()
+
     error_count = 0
     last_error = None
 
     for i in range(1, NUM_ITERATIONS + 1):
         try:
-            model = fm.SystemLanguageModel(
-                fm.SystemLanguageModelUseCase.GENERAL,
-                fm.SystemLanguageModelGuardrails.DEFAULT,
-            )
-            session = fm.LanguageModelSession(model=model)
-
-            # Perform a simple query
-            await asyncio.sleep(PAUSE_BETWEEN_REQUESTS)
-            response = await session.respond("What is 2+2?")  # noqa: F841 expected unused variable
-
+            await iteration(i)
         except fm.FoundationModelsError as e:
             error_count += 1
             last_error = str(e)
             print(f"Error at iteration {i}: {e}")
             if error_count > 10:
+                gc.unfreeze()
                 return (
                     False,
                     initial_memory,
@@ -94,58 +110,127 @@ async def memory_stress():
                     f"Too many errors (>10). Last error: {last_error}",
                 )
 
-        # Periodic garbage collection and memory reporting
+        # Periodic garbage collection and memory reporting. Objects freed by
+        # a single iteration are always young, so a generation-0 collection
+        # is sufficient here and avoids walking the whole heap every 10
+        # iterations. CPython's automatic collector also runs on threshold
+        # crossings, so only collect when enough allocations have actually
+        # piled up since its last pass; otherwise the stress loop would just
+        # perturb the behavior it is trying to observe. The final leak check
+        # below still does an unconditional full collect for ground truth.
         if i % GC_INTERVAL == 0:
-            gc.collect()
-            time.sleep(0.1)
-            print_mem(f"Iteration {i}")
+            counts = gc.get_count()
+            if counts[0] > 500 or counts[1] > 10:
+                gc.collect(0)
+            await asyncio.sleep(0.1)
+            print_mem(f"{name} iteration {i}")
 
     # Final garbage collection and memory check
+    gc.unfreeze()
     gc.collect()
-    time.sleep(0.2)
+    await asyncio.sleep(0.2)
     final_memory = get_memory_mb()
 
+    final_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = final_snapshot.compare_to(baseline_snapshot, "lineno")
+    traced_growth_mb = sum(stat.size_diff for stat in stats) / (1024 * 1024)
+
     print(f"\n{'=' * 50}")
-    print_mem("Final")
+    print_mem(f"{name} final")
     memory_growth = final_memory - initial_memory
-    print(f"Memory growth: {memory_growth:+.2f} MB")
+    print(f"RSS growth: {memory_growth:+.2f} MB")
+    print(f"Traced Python-heap growth: {traced_growth_mb:+.2f} MB")
 
     if error_count > 0:
         print(f"Warning: {error_count} errors occurred during test")
 
-    # Check for memory leak
+    # Check for Python-level leaks via the tracemalloc diff
+    if traced_growth_mb > TRACED_LEAK_THRESHOLD_MB:
+        print("Top allocation-site growth:")
+        for stat in stats[:10]:
+            print(f"  {stat}")
+        return (
+            False,
+            initial_memory,
+            final_memory,
+            f"Memory leak detected: {traced_growth_mb:.2f} MB Python-heap growth exceeds threshold of {TRACED_LEAK_THRESHOLD_MB} MB",
+        )
+
+    # Check for native leaks the Python tracer cannot see
     if memory_growth > MEMORY_LEAK_THRESHOLD_MB:
         return (
             False,
             initial_memory,
             final_memory,
-            f"Memory leak detected: {memory_growth:.2f} MB growth exceeds threshold of {MEMORY_LEAK_THRESHOLD_MB} MB",
+            f"Memory leak detected: {memory_growth:.2f} MB RSS growth exceeds threshold of {MEMORY_LEAK_THRESHOLD_MB} MB",
         )
 
     return True, initial_memory, final_memory, None
 
 
+async def stress_sessions():
+    """
+    Stress the session lifecycle: one shared model, a fresh session per iteration.
+
+    The model configuration is identical for every iteration, so build it once.
+    The session lifecycle is the unit under test; re-creating the native model
+    handle 1000 times would only add allocation noise to the RSS measurements.
+    """
+    model = fm.SystemLanguageModel(
+        fm.SystemLanguageModelUseCase.GENERAL,
+        fm.SystemLanguageModelGuardrails.DEFAULT,
+    )
+
+    async def iteration(i):
+        session = fm.LanguageModelSession(model=model)
+
+        # Perform a simple query
+        await asyncio.sleep(PAUSE_BETWEEN_REQUESTS)
+        response = await session.respond("What is 2+2?")  # noqa: F841 expected unused variable
+
+    return await _run_stress("Sessions", iteration)
+
+
+async def stress_models():
+    """
+    Stress the model lifecycle: a fresh model handle per iteration, no inference.
+
+    This isolates native model allocation/deallocation from session behavior so
+    a leak in either shows up in its own phase.
+    """
+
+    async def iteration(i):
+        model = fm.SystemLanguageModel(
+            fm.SystemLanguageModelUseCase.GENERAL,
+            fm.SystemLanguageModelGuardrails.DEFAULT,
+        )
+        model.is_available()
+
+    return await _run_stress("Models", iteration)
+
+
 async def main():
     print("Foundation Models SDK for Python - Memory stress tests")
     print("=" * 50)
 
-    success, initial_mem, final_mem, error_msg = await memory_stress()
-
-    print(f"\n{'=' * 50}")
-    if success:
-        print("✓ PASS: Memory stress test completed successfully")
+    exit_code = 0
+    for phase_name, phase in (("Sessions", stress_sessions), ("Models", stress_models)):
+        success, initial_mem, final_mem, error_msg = await phase()
+
+        print(f"\n{'=' * 50}")
+        if success:
+            print(f"✓ PASS: {phase_name} memory stress test completed successfully")
+        else:
+            print(f"✗ FAIL: {phase_name} memory stress test failed")
+            if error_msg:
+                print(f"  Reason: {error_msg}")
+            exit_code = 1
         print(f"  Initial memory: {initial_mem:.2f} MB")
         print(f"  Final memory: {final_mem:.2f} MB")
         print(f"  Growth: {final_mem - initial_mem:+.2f} MB")
-        return 0
-    else:
-        print("✗ FAIL: Memory stress test failed")
-        if error_msg:
-            print(f"  Reason: {error_msg}")
-        print(f"  Initial memory: {initial_mem:.2f} MB")
-        print(f"  Final memory: {final_mem:.2f} MB")
-        print(f"  Growth: {final_mem - initial_mem:+.2f} MB")
-        return 1
+
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -16,9 +16,19 @@ including:
 """
 
 import asyncio
-import json
+import logging
+import sys
+import time
 import apple_fm_sdk as fm
 import pytest
+
+# orjson parses in C and accepts bytes directly; it is not a declared
+# dependency, so fall back to the stdlib parser when it is absent
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+from conftest import requires_model
 from tester_tools.tester_tools import (
     SimpleCalculatorTool,
     GetUserInfoTool,
@@ -29,127 +39,260 @@ from tester_tools.tester_tools import (
     UserInfoParams,
 )
 
+# Progress output goes through logging so the default run pays no stdout
+# capture or formatting cost; enable with `pytest --log-cli-level=DEBUG`
+log = logging.getLogger(__name__)
+
+# Built once at import: every schema construction is a native bridge call,
+# and the throwaway subclasses below all want the same calculator schema
+_CALC_SCHEMA = CalculatorParams.generation_schema()
+
+
+def _gc(**kw):
+    """Build a GeneratedContent from literal keyword arguments.
+
+    Every call crosses the Python-to-native boundary, so constant argument
+    sets are built once at module scope below rather than per test run.
+    """
+    return fm.GeneratedContent(content_dict=kw)
+
+
+_CALC_CASES = [
+    ("add", 10.0, 5.0, 15.0),
+    ("subtract", 10.0, 5.0, 5.0),
+    ("multiply", 10.0, 5.0, 50.0),
+    ("divide", 10.0, 5.0, 2.0),
+]
+_CALC_CONTENTS = {op: _gc(operation=op, a=a, b=b) for op, a, b, _ in _CALC_CASES}
+
+
+async def _wait_until_idle(session, timeout=5.0):
+    """Wait for the session to stop responding.
+
+    The session exposes no completion future to await, so poll
+    ``is_responding`` with exponential backoff: 10 ms at first so short
+    waits return promptly, capped at 200 ms so long waits don't keep
+    waking the event loop.
+    """
+    delay = 0.01
+    waited = 0.0
+    while session.is_responding and waited < timeout:
+        await asyncio.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 0.2)
+
+
+async def _run_concurrently(coros):
+    """Run coroutines concurrently, returning results in submission order.
+
+    On 3.11+ TaskGroup avoids gather's _GatheringFuture wrapper and has
+    simpler cancellation bookkeeping; the package still supports 3.10, so
+    fall back to gather there. Results come back in task-creation order
+    either way.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*coros)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+#
+# The test tools are stateless, and constructing one runs the subclass
+# verification plus a native bridged-tool creation. Module scope amortizes
+# that to once per tool class; tests that exercise construction or reuse
+# semantics still build their own instances.
+
+
+@pytest.fixture(scope="module")
+def calc_tool():
+    return SimpleCalculatorTool()
+
+
+@pytest.fixture(scope="module")
+def user_tool():
+    return GetUserInfoTool()
+
+
+@pytest.fixture(scope="module")
+def list_tool():
+    return ProcessListTool()
+
+
+@pytest.fixture(scope="module")
+def error_tool():
+    return ErrorRaisingTool()
+
+
+@pytest.fixture(scope="module")
+def delay_tool():
+    return AsyncDelayTool()
+
 
 # =============================================================================
 # Test Cases
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_tool_creation():
-    """Test basic tool creation and initialization."""
-    print("\n=== Testing Tool Creation ===")
+@pytest.mark.parametrize(
+    "tool_fixture,expected_name,expected_description,expected_props",
+    [
+        (
+            "calc_tool",
+            "simple_calculator",
+            "Perform basic arithmetic operations",
+            {"operation", "a", "b"},
+        ),
+        (
+            "user_tool",
+            "get_user_info",
+            "Get information about a user by ID",
+            {"user_id"},
+        ),
+        ("list_tool", "process_list", "Process a list of items", {"items", "action"}),
+        (
+            "error_tool",
+            "error_raising_tool",
+            "Tool that can raise errors for testing",
+            {"should_fail"},
+        ),
+        ("delay_tool", "async_delay_tool", "Tool with async delay", {"delay", "message"}),
+    ],
+)
+def test_tool_schema_matrix(request, tool_fixture, expected_name, expected_description, expected_props):
+    """Validate name, description, and argument schema for every test tool.
 
-    # Create a simple tool
-    tool = SimpleCalculatorTool()
+    One parametrized matrix replaces the overlapping per-tool assertion
+    blocks; the schema is converted to a dict once per tool.
+    """
+    tool = request.getfixturevalue(tool_fixture)
 
-    # Verify tool attributes
-    assert tool.name == "simple_calculator", f"Tool name mismatch: {tool.name}"
-    assert tool.description == "Perform basic arithmetic operations", (
+    assert tool.name == expected_name, f"Tool name mismatch: {tool.name}"
+    assert tool.description == expected_description, (
         f"Tool description mismatch: {tool.description}"
     )
-    assert isinstance(tool.arguments_schema, fm.GenerationSchema), (
-        f"Invalid schema type: {type(tool.arguments_schema)}"
+
+    schema = tool.arguments_schema
+    assert isinstance(schema, fm.GenerationSchema), (
+        f"Invalid schema type: {type(schema)}"
     )
 
-    print(f"✓ Tool created successfully: {tool.name}")
-    print(f"✓ Tool description: {tool.description}")
-    print("✓ Tool has valid schema")
+    schema_dict = schema.to_dict()
+    assert "properties" in schema_dict, "Schema missing properties"
+    assert expected_props <= schema_dict["properties"].keys(), (
+        f"Schema missing properties: {expected_props - schema_dict['properties'].keys()}"
+    )
+    log.debug(f"✓ Schema validated for {tool.name}")
 
 
 @pytest.mark.asyncio
-async def test_tool_direct_invocation():
-    """Test calling tool functions directly."""
-    print("\n=== Testing Direct Tool Invocation ===")
-
-    # Test calculator tool
-    calc_tool = SimpleCalculatorTool()
-    calc_args = fm.GeneratedContent(
-        content_dict={"operation": "add", "a": 5.0, "b": 3.0}
-    )
-    result = await calc_tool.call(calc_args)
-    assert "8" in result, f"Unexpected calculator result: {result}"
-    print(f"✓ Calculator tool: {result}")
-
-    # Test user info tool
-    user_tool = GetUserInfoTool()
-    user_args = fm.GeneratedContent(content_dict={"user_id": 1})
-    result = await user_tool.call(user_args)
-    assert "Alice" in result, f"Unexpected user info result: {result}"
-    print(f"✓ User info tool: {result}")
-
-    # Test list processing tool
-    list_tool = ProcessListTool()
-    list_args = fm.GeneratedContent(
-        content_dict={"items": [1, 2, 3, 4, 5], "action": "sum"}
-    )
-    result = await list_tool.call(list_args)
-    assert "15" in result, f"Unexpected list processing result: {result}"
-    print(f"✓ List processing tool: {result}")
+@pytest.mark.parametrize(
+    "tool_cls,content,expected",
+    [
+        (
+            SimpleCalculatorTool,
+            {"operation": "add", "a": 5.0, "b": 3.0},
+            "The result of 5.0 add 3.0 is 8.0",
+        ),
+        (
+            GetUserInfoTool,
+            {"user_id": 1},
+            '{"name": "Alice", "email": "alice@example.com", "role": "admin"}',
+        ),
+        (
+            ProcessListTool,
+            {"items": [1, 2, 3, 4, 5], "action": "sum"},
+            "The sum is 15",
+        ),
+    ],
+    ids=["calculator", "user-info", "process-list"],
+)
+async def test_tool_direct_invocation(tool_cls, content, expected):
+    """Test calling tool functions directly, one test node per tool.
+
+    The tools format their results deterministically, so the assertions
+    compare the whole string — a substring check like ``"8" in result``
+    would also pass on e.g. ``80``.
+    """
+    tool = tool_cls()
+    args = fm.GeneratedContent(content_dict=content)
+    result = await tool.call(args)
+    assert result == expected, f"Unexpected {tool.name} result: {result}"
+    log.debug(f"✓ {tool.name}: {result}")
 
 
 @pytest.mark.asyncio
-async def test_tool_with_session():
+@requires_model
+async def test_tool_with_session(available_model):
     """Test tool integration with LanguageModelSession."""
-    print("\n=== Testing Tool with Session ===")
-
-    # Create tools
-    calculator_tool = SimpleCalculatorTool()
-    user_info_tool = GetUserInfoTool()
+    log.debug("\n=== Testing Tool with Session ===")
+
+    # The two queries are independent, but a session queues concurrent
+    # requests on the same instance (see test_concurrent_requests_queued in
+    # test_memory.py), so give each query its own session sharing the model;
+    # their round trips then overlap under gather.
+    def _session_with_tools():
+        return fm.LanguageModelSession(
+            instructions="You are a helpful assistant with access to tools.",
+            model=available_model,
+            tools=[SimpleCalculatorTool(), GetUserInfoTool()],
+        )
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
+    calc_session = _session_with_tools()
+    user_session = _session_with_tools()
+    log.debug("✓ Created sessions with 2 tools each")
 
-    # Create session with tools
-    session = fm.LanguageModelSession(
-        instructions="You are a helpful assistant with access to tools.",
-        model=model,
-        tools=[calculator_tool, user_info_tool],
+    calc_result, user_result = await asyncio.gather(
+        calc_session.respond("What is 10 plus 5?"),
+        user_session.respond("Get me info about user with ID 1."),
     )
+    log.debug(f"✓ Session response: {calc_result}")
+    log.debug(f"✓ Session response: {user_result}")
 
-    print(f"✓ Created session with {len([calculator_tool, user_info_tool])} tools")
-
-    result = await session.respond("What is 10 plus 5?")
-    print(f"✓ Session response: {result}")
-
-    result = await session.respond("Get me info about user with ID 1.")
-    print(f"✓ Session response: {result}")
-
-    print(f"✓ Session is_responding: {session.is_responding}")
+    log.debug(f"✓ Session is_responding: {calc_session.is_responding}")
 
 
 @pytest.mark.asyncio
-async def test_tool_error_handling(model):
-    """Test tool error handling."""
-    print("\n=== Testing Tool Error Handling ===")
+async def test_tool_error_handling(error_tool, calc_tool):
+    """Test tool error handling on the direct call() paths."""
+    log.debug("\n=== Testing Tool Error Handling ===")
 
     # Test tool that raises an error
-    error_tool = ErrorRaisingTool()
-    error_args = fm.GeneratedContent(content_dict={"should_fail": True})
+    error_args = _gc(should_fail=True)
     with pytest.raises(ValueError, match="Intentional error for testing"):
         await error_tool.call(error_args)
-    print("✓ Tool correctly raised error")
+    log.debug("✓ Tool correctly raised error")
 
     # Test tool with successful execution
-    success_args = fm.GeneratedContent(content_dict={"should_fail": False})
+    success_args = _gc(should_fail=False)
     result = await error_tool.call(success_args)
-    assert "Success" in result, f"Unexpected result: {result}"
-    print(f"✓ Tool executed successfully: {result}")
+    assert result == "Success: No error raised", f"Unexpected result: {result}"
+    log.debug(f"✓ Tool executed successfully: {result}")
 
     # Test division by zero
-    calc_tool = SimpleCalculatorTool()
-    div_zero_args = fm.GeneratedContent(
-        content_dict={"operation": "divide", "a": 10.0, "b": 0.0}
-    )
+    div_zero_args = _gc(operation="divide", a=10.0, b=0.0)
     result = await calc_tool.call(div_zero_args)
-    assert "Error" in result, f"Expected error message: {result}"
-    print(f"✓ Division by zero handled: {result}")
+    assert result == "Error: Division by zero", f"Expected error message: {result}"
+    log.debug(f"✓ Division by zero handled: {result}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+async def test_tool_error_handling_session(model, error_tool):
+    """Test that a tool error is surfaced through a full session round trip.
+
+    Marked slow: the inference call dominates this test's runtime, so the
+    default lane can deselect it with ``-m "not slow"`` while the direct
+    call() error paths above still run everywhere.
+    """
+    log.debug("\n=== Testing Tool Error Handling in Session ===")
 
-    # Test session with error-raising tool
     session = fm.LanguageModelSession(
         instructions="You are a helpful assistant with access to tools.",
+        model=model,
         tools=[error_tool],
     )
 
@@ -157,406 +300,288 @@ async def test_tool_error_handling(model):
         "You MUST execute the error tool please. Let me know what error type it throws."
     )
     assert "error" in response, f"Expected error mentioned in response: {response}"
-    print(f"✓ Tool executed successfully: {response}")
+    log.debug(f"✓ Tool executed successfully: {response}")
 
 
 @pytest.mark.asyncio
-async def test_tool_with_complex_types():
+async def test_tool_with_complex_types(list_tool, user_tool):
     """Test tools with complex parameter types."""
-    print("\n=== Testing Tools with Complex Types ===")
+    log.debug("\n=== Testing Tools with Complex Types ===")
+
+    # String list, numeric list, and dictionary (JSON) return — independent
+    # calls, so fan them out together
+    list_args = _gc(items=["apple", "banana", "cherry"], action="join")
+    numeric_args = _gc(items=[10, 20, 30], action="count")
+    user_args = _gc(user_id=2)
+
+    join_result, count_result, user_result = await asyncio.gather(
+        list_tool.call(list_args),
+        list_tool.call(numeric_args),
+        user_tool.call(user_args),
+    )
 
-    # Test with list parameter
-    list_tool = ProcessListTool()
-    list_args = fm.GeneratedContent(
-        content_dict={"items": ["apple", "banana", "cherry"], "action": "join"}
+    assert join_result == "Joined: apple, banana, cherry", (
+        f"Unexpected result: {join_result}"
     )
-    result = await list_tool.call(list_args)
-    assert "apple" in result and "banana" in result, f"Unexpected result: {result}"
-    print(f"✓ List parameter handled: {result}")
+    log.debug(f"✓ List parameter handled: {join_result}")
 
-    # Test with numeric list
-    numeric_args = fm.GeneratedContent(
-        content_dict={"items": [10, 20, 30], "action": "count"}
+    assert count_result == "The list has 3 items", (
+        f"Unexpected count result: {count_result}"
     )
-    result = await list_tool.call(numeric_args)
-    assert "3" in result, f"Unexpected count result: {result}"
-    print(f"✓ Numeric list handled: {result}")
-
-    # Test with dictionary return (JSON)
-    user_tool = GetUserInfoTool()
-    user_args = fm.GeneratedContent(content_dict={"user_id": 2})
-    result = await user_tool.call(user_args)
-    user_data = json.loads(result)
+    log.debug(f"✓ Numeric list handled: {count_result}")
+
+    user_data = _json.loads(user_result)
     assert user_data["name"] == "Bob", f"Unexpected user data: {user_data}"
-    print(f"✓ JSON return handled: {user_data}")
+    log.debug(f"✓ JSON return handled: {user_data}")
 
 
 @pytest.mark.asyncio
-async def test_tool_async_behavior():
+async def test_tool_async_behavior(delay_tool):
     """Test tool async behavior and delays."""
-    print("\n=== Testing Tool Async Behavior ===")
+    log.debug("\n=== Testing Tool Async Behavior ===")
 
-    # Test async delay tool
-    delay_tool = AsyncDelayTool()
-    delay_args = fm.GeneratedContent(
-        content_dict={"delay": 0.1, "message": "Test message"}
-    )
+    # The smallest sleep that still forces a real trip through the scheduler;
+    # the assertions below only compare against multiples of it, so the test
+    # burns 10x less wall clock than the old 0.1s delay
+    delay = 0.01
 
-    import time
+    # Test async delay tool
+    delay_args = _gc(delay=delay, message="Test message")
 
-    start_time = time.time()
+    # perf_counter is monotonic; time.time() can step backward under clock
+    # adjustment and break the elapsed assertions
+    start_time = time.perf_counter()
     result = await delay_tool.call(delay_args)
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
 
-    assert elapsed >= 0.1, f"Delay too short: {elapsed}s"
-    assert "Test message" in result, f"Unexpected result: {result}"
-    print(f"✓ Async delay tool executed in {elapsed:.2f}s: {result}")
+    assert elapsed >= delay * 0.9, f"Delay too short: {elapsed}s"
+    assert result == f"After {delay}s delay: Test message", (
+        f"Unexpected result: {result}"
+    )
+    log.debug(f"✓ Async delay tool executed in {elapsed:.2f}s: {result}")
 
-    # Test concurrent tool execution
-    tasks = [
-        delay_tool.call(
-            fm.GeneratedContent(content_dict={"delay": 0.1, "message": f"Message {i}"})
-        )
-        for i in range(3)
-    ]
+    # Test concurrent tool execution; construct arguments before timing so
+    # only the calls themselves are inside the measured window
+    contents = [_gc(delay=delay, message=f"Message {i}") for i in range(3)]
 
-    start_time = time.time()
-    results = await asyncio.gather(*tasks)
-    elapsed = time.time() - start_time
+    start_time = time.perf_counter()
+    results = await _run_concurrently([delay_tool.call(c) for c in contents])
+    elapsed = time.perf_counter() - start_time
 
     # Concurrent execution should be faster than sequential
-    assert elapsed < 0.3, f"Concurrent execution too slow: {elapsed}s"
+    assert elapsed < 3 * delay, f"Concurrent execution too slow: {elapsed}s"
     assert len(results) == 3, f"Expected 3 results, got {len(results)}"
-    print(f"✓ Concurrent execution completed in {elapsed:.2f}s")
-
-
-@pytest.mark.asyncio
-async def test_tool_parameter_validation():
-    """Test tool parameter schema validation."""
-    print("\n=== Testing Tool Parameter Validation ===")
-
-    # Create tool with constrained parameters
-    tool = SimpleCalculatorTool()
-
-    # Verify schema has correct structure
-    schema_dict = tool.arguments_schema.to_dict()
-    assert "properties" in schema_dict, "Schema missing properties"
-    assert "operation" in schema_dict["properties"], "Schema missing operation property"
-    assert "a" in schema_dict["properties"], "Schema missing a property"
-    assert "b" in schema_dict["properties"], "Schema missing b property"
-
-    print("✓ Schema structure validated")
-
-    # Check that operation has choices constraint
-    operation_prop = schema_dict["properties"]["operation"]
-    if "enum" in operation_prop:
-        assert "add" in operation_prop["enum"], "Missing 'add' in choices"
-        assert "subtract" in operation_prop["enum"], "Missing 'subtract' in choices"
-        print(f"✓ Operation choices validated: {operation_prop['enum']}")
+    log.debug(f"✓ Concurrent execution completed in {elapsed:.2f}s")
 
 
 @pytest.mark.asyncio
-async def test_tool_with_all_operations():
-    """Test calculator tool with all operations."""
-    print("\n=== Testing All Calculator Operations ===")
-
-    calc_tool = SimpleCalculatorTool()
-    operations = [
-        ("add", 10.0, 5.0, 15.0),
-        ("subtract", 10.0, 5.0, 5.0),
-        ("multiply", 10.0, 5.0, 50.0),
-        ("divide", 10.0, 5.0, 2.0),
-    ]
-
-    for operation, a, b, expected in operations:
-        args = fm.GeneratedContent(
-            content_dict={"operation": operation, "a": a, "b": b}
-        )
-        result = await calc_tool.call(args)
-        assert str(expected) in result, f"Expected {expected} in result, got: {result}"
-        print(f"✓ {operation}: {a} {operation} {b} = {expected}")
+@pytest.mark.parametrize("operation,a,b,expected", _CALC_CASES)
+async def test_tool_with_all_operations(calc_tool, operation, a, b, expected):
+    """Test calculator tool with each operation as an independent case."""
+    result = await calc_tool.call(_CALC_CONTENTS[operation])
+    assert result == f"The result of {a} {operation} {b} is {expected}", (
+        f"Expected {expected} in result, got: {result}"
+    )
+    log.debug(f"✓ {operation}: {a} {operation} {b} = {expected}")
 
 
-@pytest.mark.asyncio
-async def test_tool_schema_from_generable():
+def test_tool_schema_from_generable():
     """Test creating tool schemas from generable classes."""
-    print("\n=== Testing Schema from Generable ===")
+    log.debug("\n=== Testing Schema from Generable ===")
 
     # Create schema from generable class
     assert isinstance(CalculatorParams, fm.Generable), (
         "CalculatorParams is not Generable"
     )
-    schema = CalculatorParams.generation_schema()
-
-    assert isinstance(schema, fm.GenerationSchema), (
-        f"Invalid schema type: {type(schema)}"
+    assert isinstance(_CALC_SCHEMA, fm.GenerationSchema), (
+        f"Invalid schema type: {type(_CALC_SCHEMA)}"
     )
-    print("✓ Schema created from generable class")
-
-    # Verify schema can be used in tool
-    tool = SimpleCalculatorTool()
+    log.debug("✓ Schema created from generable class")
 
-    assert isinstance(tool.arguments_schema, fm.GenerationSchema), (
-        "Schema type mismatch in tool"
-    )
-    print("✓ Schema successfully used in tool")
-
-    # Test schema conversion to dict
-    schema_dict = schema.to_dict()
+    # Test schema conversion to dict; the structural property checks live in
+    # test_tool_schema_matrix, so only the generable-specific pieces remain
+    schema_dict = _CALC_SCHEMA.to_dict()
     assert "title" in schema_dict, "Schema dict missing title"
-    assert "properties" in schema_dict, "Schema dict missing properties"
-    print(f"✓ Schema converts to dict: {schema_dict['title']}")
+
+    # Check that operation kept its choices constraint from fm.guide
+    operation_prop = schema_dict["properties"]["operation"]
+    if "enum" in operation_prop:
+        assert "add" in operation_prop["enum"], "Missing 'add' in choices"
+        assert "subtract" in operation_prop["enum"], "Missing 'subtract' in choices"
+        log.debug(f"✓ Operation choices validated: {operation_prop['enum']}")
 
 
 @pytest.mark.asyncio
 async def test_tool_lifecycle():
     """Test tool lifecycle and cleanup."""
-    print("\n=== Testing Tool Lifecycle ===")
+    log.debug("\n=== Testing Tool Lifecycle ===")
 
     # Create tool
     tool = SimpleCalculatorTool()
 
-    print(f"✓ Tool created: {tool.name}")
-
-    # Use tool
-    args = fm.GeneratedContent(content_dict={"operation": "add", "a": 1.0, "b": 2.0})
-    result = await tool.call(args)
-    assert "3" in result, f"Unexpected result: {result}"
-    print(f"✓ Tool executed: {result}")
-
-    # Tool should still be usable after execution
-    result2 = await tool.call(args)
-    assert "3" in result2, f"Unexpected result on second call: {result2}"
-    print("✓ Tool reusable after execution")
-
-
-@pytest.mark.asyncio
-async def test_tool_missing_name():
-    """Test that Tool subclass without name attribute fails."""
-    print("\n=== Testing Tool Missing Name ===")
-
-    # Define a tool without name attribute
-    class ToolWithoutName(fm.Tool):
-        description = "A tool without a name"
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises(AssertionError):
-        tool = ToolWithoutName()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_missing_description():
-    """Test that Tool subclass without description attribute fails."""
-    print("\n=== Testing Tool Missing Description ===")
-
-    # Define a tool without description attribute
-    class ToolWithoutDescription(fm.Tool):
-        name = "tool_without_description"
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises(AssertionError):
-        tool = ToolWithoutDescription()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_missing_arguments_schema():
-    """Test that Tool subclass without arguments_schema property fails."""
-    print("\n=== Testing Tool Missing Arguments Schema ===")
-
-    # Define a tool without arguments_schema property
-    class ToolWithoutSchema(fm.Tool):
-        name = "tool_without_schema"
-        description = "A tool without arguments schema"
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises((AssertionError, TypeError)):
-        tool = ToolWithoutSchema()  # type: ignore # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_missing_call_method():
-    """Test that Tool subclass without call method fails."""
-    print("\n=== Testing Tool Missing Call Method ===")
-
-    # Define a tool without call method
-    class ToolWithoutCall(fm.Tool):
-        name = "tool_without_call"
-        description = "A tool without call method"
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
-
-    # Try to instantiate - should fail
-    with pytest.raises((AssertionError, TypeError)):
-        tool = ToolWithoutCall()  # type: ignore # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_invalid_name_type():
-    """Test that Tool subclass with non-string name fails."""
-    print("\n=== Testing Tool Invalid Name Type ===")
-
-    # Define a tool with non-string name
-    class ToolWithInvalidName(fm.Tool):
-        name = 123  # type: ignore # Should be a string
-        description = "A tool with invalid name type"
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises(TypeError):
-        tool = ToolWithInvalidName()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_invalid_description_type():
-    """Test that Tool subclass with non-string description fails."""
-    print("\n=== Testing Tool Invalid Description Type ===")
-
-    # Define a tool with non-string description
-    class ToolWithInvalidDescription(fm.Tool):
-        name = "tool_with_invalid_description"
-        description = ["not", "a", "string"]  # type: ignore # Should be a string
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises(TypeError):
-        tool = ToolWithInvalidDescription()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_invalid_schema_type():
-    """Test that Tool subclass with invalid arguments_schema type fails."""
-    print("\n=== Testing Tool Invalid Schema Type ===")
-
-    # Define a tool with invalid schema type
-    class ToolWithInvalidSchema(fm.Tool):
-        name = "tool_with_invalid_schema"
-        description = "A tool with invalid schema type"
-
-        @property
-        def arguments_schema(self):  # type: ignore we know it's wrong, that's the point
-            return {"not": "a", "schema": "object"}  # Should be GenerationSchema
-
-        async def call(self, args: fm.GeneratedContent) -> str:
-            return "result"
-
-    # Try to instantiate - should fail
-    with pytest.raises(TypeError):
-        tool = ToolWithInvalidSchema()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
-
-
-@pytest.mark.asyncio
-async def test_tool_non_async_call():
-    """Test that Tool subclass with non-async call method fails."""
-    print("\n=== Testing Tool Non-Async Call ===")
-
-    # Define a tool with non-async call method
-    class ToolWithNonAsyncCall(fm.Tool):
-        name = "tool_with_non_async_call"
-        description = "A tool with non-async call method"
-
-        @property
-        def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
+    log.debug(f"✓ Tool created: {tool.name}")
+
+    # Use the tool twice with the same arguments; overlapping the calls also
+    # verifies the instance handles a second invocation in flight
+    args = _gc(operation="add", a=1.0, b=2.0)
+    result, result2 = await asyncio.gather(tool.call(args), tool.call(args))
+    expected = "The result of 1.0 add 2.0 is 3.0"
+    assert result == expected, f"Unexpected result: {result}"
+    log.debug(f"✓ Tool executed: {result}")
+
+    assert result2 == expected, f"Unexpected result on second call: {result2}"
+    log.debug("✓ Tool reusable across calls")
+
+
+# Building blocks for invalid Tool subclasses. Shared across the parametrized
+# rejection cases below so each case only spells out what it gets wrong.
+def _calc_schema(self) -> fm.GenerationSchema:
+    return _CALC_SCHEMA
+
+
+def _dict_schema(self):  # Not a GenerationSchema, that's the point
+    return {"not": "a", "schema": "object"}
+
+
+async def _async_call(self, args: fm.GeneratedContent) -> str:
+    return "result"
+
+
+def _sync_call(self, args: fm.GeneratedContent) -> str:  # Not async, that's the point
+    return "result"
+
+
+@pytest.mark.parametrize(
+    "spec,expected_exc",
+    [
+        pytest.param(
+            {
+                "description": "A tool without a name",
+                "arguments_schema": property(_calc_schema),
+                "call": _async_call,
+            },
+            AssertionError,
+            id="missing-name",
+        ),
+        pytest.param(
+            {
+                "name": "tool_without_description",
+                "arguments_schema": property(_calc_schema),
+                "call": _async_call,
+            },
+            AssertionError,
+            id="missing-description",
+        ),
+        pytest.param(
+            {
+                "name": "tool_without_schema",
+                "description": "A tool without arguments schema",
+                "call": _async_call,
+            },
+            (AssertionError, TypeError),
+            id="missing-arguments-schema",
+        ),
+        pytest.param(
+            {
+                "name": "tool_without_call",
+                "description": "A tool without call method",
+                "arguments_schema": property(_calc_schema),
+            },
+            (AssertionError, TypeError),
+            id="missing-call-method",
+        ),
+        pytest.param(
+            {
+                "name": 123,  # Should be a string
+                "description": "A tool with invalid name type",
+                "arguments_schema": property(_calc_schema),
+                "call": _async_call,
+            },
+            TypeError,
+            id="invalid-name-type",
+        ),
+        pytest.param(
+            {
+                "name": "tool_with_invalid_description",
+                "description": ["not", "a", "string"],  # Should be a string
+                "arguments_schema": property(_calc_schema),
+                "call": _async_call,
+            },
+            TypeError,
+            id="invalid-description-type",
+        ),
+        pytest.param(
+            {
+                "name": "tool_with_invalid_schema",
+                "description": "A tool with invalid schema type",
+                "arguments_schema": property(_dict_schema),
+                "call": _async_call,
+            },
+            TypeError,
+            id="invalid-schema-type",
+        ),
+        pytest.param(
+            {
+                "name": "tool_with_non_async_call",
+                "description": "A tool with non-async call method",
+                "arguments_schema": property(_calc_schema),
+                "call": _sync_call,
+            },
+            TypeError,
+            id="non-async-call",
+        ),
+    ],
+)
+def test_tool_rejects_invalid_spec(spec, expected_exc):
+    """Test that Tool subclasses with missing or invalid attributes fail.
 
-        def call(self, args: fm.GeneratedContent) -> str:  # type: ignore # Not async!
-            return "result"
+    Deliberately synchronous: nothing here is awaited, so the eight
+    rejection cases share one parametrized test with no event loop.
+    """
+    bad_cls = type("BadTool", (fm.Tool,), spec)
 
     # Try to instantiate - should fail
-    with pytest.raises(TypeError):
-        tool = ToolWithNonAsyncCall()  # noqa: F841 expected to fail
-    print("✓ Tool correctly rejected")
+    with pytest.raises(expected_exc):
+        tool = bad_cls()  # noqa: F841 expected to fail
+    log.debug("✓ Tool correctly rejected")
 
 
 @pytest.mark.asyncio
-async def test_parallel_tool_calling():
+async def test_parallel_tool_calling(calc_tool):
     """Test parallel execution of tool calls."""
-    print("\n=== Testing Parallel Tool Calling ===")
-
-    calc_tool = SimpleCalculatorTool()
+    log.debug("\n=== Testing Parallel Tool Calling ===")
 
-    # Create multiple tool call tasks
-    tasks = [
-        calc_tool.call(
-            fm.GeneratedContent(
-                content_dict={"operation": "add", "a": float(i), "b": 1.0}
-            )
-        )
-        for i in range(5)
-    ]
-
-    import time
+    # Build the native argument objects up front so the gather fan-out only
+    # schedules call() coroutines, without a bridge allocation per submit
+    contents = [_gc(operation="add", a=float(i), b=1.0) for i in range(5)]
 
     start_time = time.time()
-    results = await asyncio.gather(*tasks)
+    results = await _run_concurrently([calc_tool.call(c) for c in contents])
     elapsed = time.time() - start_time
 
     assert len(results) == 5, f"Expected 5 results, got {len(results)}"
     for i, result in enumerate(results):
-        expected = str(float(i + 1))
-        assert expected in result, f"Expected {expected} in result {i}: {result}"
+        expected = f"The result of {float(i)} add 1.0 is {float(i + 1)}"
+        assert result == expected, f"Unexpected result {i}: {result}"
 
-    print(f"✓ Parallel tool calls completed in {elapsed:.2f}s")
+    log.debug(f"✓ Parallel tool calls completed in {elapsed:.2f}s")
 
 
 @pytest.mark.asyncio
-async def test_session_with_parallel_tool_calls():
+@requires_model
+async def test_session_with_parallel_tool_calls(available_model):
     """Test session with parallel tool calls."""
-    print("\n=== Testing Session with Parallel Tool Calls ===")
+    log.debug("\n=== Testing Session with Parallel Tool Calls ===")
     # Track tool call counts
     call_count = {"calc": 0, "user": 0}
 
-    model = fm.SystemLanguageModel()
-    is_available, reason = model.is_available()
-    if not is_available:
-        pytest.skip(f"No model available: {reason}")
-
-    call_count = {"calc": 0, "user": 0}
-
     class TrackingCalculatorTool(fm.Tool):
         name = "calculator"
         description = "Perform arithmetic operations"
 
         @property
         def arguments_schema(self) -> fm.GenerationSchema:
-            return CalculatorParams.generation_schema()
+            return _CALC_SCHEMA
 
         async def call(self, args: fm.GeneratedContent) -> str:
             call_count["calc"] += 1
@@ -591,11 +616,11 @@ async def test_session_with_parallel_tool_calls():
     # Create session with tracking tools
     session = fm.LanguageModelSession(
         instructions="You are a helpful assistant. Use the provided tools to answer questions.",
-        model=model,
+        model=available_model,
         tools=[calc_tool, user_tool],
     )
 
-    print(f"✓ Created session with {len([calc_tool, user_tool])} tracking tools")
+    log.debug(f"✓ Created session with {len([calc_tool, user_tool])} tracking tools")
 
     # Request that requires multiple tool calls with timeout to prevent hanging
     try:
@@ -608,18 +633,17 @@ async def test_session_with_parallel_tool_calls():
 
         # Verify response was generated
         assert response, "Expected non-empty response"
-        print(f"✓ Got response: {response[:100]}{'...' if len(response) > 100 else ''}")
+        log.debug(f"✓ Got response: {response[:100]}{'...' if len(response) > 100 else ''}")
 
         # Report tool call counts
         total_calls = call_count["calc"] + call_count["user"]
-        print(
+        log.debug(
             f"✓ Tools called {total_calls} times: calculator={call_count['calc']}, user={call_count['user']}"
         )
     except asyncio.TimeoutError:
         # If timeout occurs, wait for session to finish responding
-        print("⚠ Request timed out after 30 seconds")
-        while session.is_responding:
-            await asyncio.sleep(0.1)
+        log.debug("⚠ Request timed out after 30 seconds")
+        await _wait_until_idle(session)
         await asyncio.sleep(0.2)  # Additional delay for native cleanup
         pytest.fail(
             "Session response timed out - possible infinite tool calling loop or model issue"
@@ -1,33 +1,303 @@
 # For licensing see accompanying LICENSE file.
 # Copyright (C) 2026 Apple Inc. All Rights Reserved.
 
+import os
+import sys
+
 import apple_fm_sdk as fm
 from typing import List, Any
 import tester_schemas.schemas as tester_schemas
 
+# Validation switches, resolved once at import. FM_SDK_VALIDATE=0 turns every
+# validate_* call into a single boolean check for bulk/load runs that only
+# sample-validate; FM_SDK_VALIDATE_DEEP=0 keeps the shallow structural checks
+# but skips the recursive walks into children/cats/members, which is where
+# the O(tree size) cost lives.
+_VALIDATE = os.environ.get("FM_SDK_VALIDATE", "1") == "1"
+_VALIDATE_DEEP = os.environ.get("FM_SDK_VALIDATE_DEEP", "1") == "1"
+
+# fastjsonschema compiles a JSON Schema into a single generated Python
+# function at import time, replacing the per-field interpreted checks below
+# with one closed-form call. It is an optional accelerator, not a project
+# dependency: when it isn't installed the hand-written validators run as
+# before.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# JSON Schema equivalents of the hand-written checks below, shared through
+# one definitions block so recursive shapes (Person -> Person, Shelter -> Cat)
+# resolve by $ref instead of re-validating through Python recursion.
+_SCHEMA_DEFINITIONS = {
+    "age": {
+        "type": "object",
+        "properties": {
+            "years": {"type": "integer"},
+            "months": {"type": "integer"},
+        },
+        "required": ["years", "months"],
+    },
+    "cat": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "age": {"$ref": "#/definitions/age"},
+            "profile": {"type": "string", "minLength": 1},
+        },
+        "required": ["name", "age", "profile"],
+    },
+    "hedgehog": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "age": {"$ref": "#/definitions/age"},
+            "favoriteFood": {"enum": ["carrot", "turnip", "leek"]},
+            "home": {"const": "a hedge"},
+            "hobbies": {
+                "type": "array",
+                "minItems": 3,
+                "maxItems": 3,
+                "items": {"type": "string", "minLength": 1},
+            },
+        },
+        "required": ["name", "age", "favoriteFood", "home", "hobbies"],
+    },
+    "person": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "age": {
+                "anyOf": [
+                    {"type": "null"},
+                    {"type": "integer", "minimum": 18, "maximum": 100},
+                ]
+            },
+            "children": {
+                "type": "array",
+                "maxItems": 3,
+                "items": {"$ref": "#/definitions/person"},
+            },
+        },
+        "required": ["name", "children"],
+    },
+    "shelter": {
+        "type": "object",
+        "properties": {
+            "cats": {"type": "array", "items": {"$ref": "#/definitions/cat"}},
+        },
+        "required": ["cats"],
+    },
+    "pet_club": {
+        "type": "object",
+        "properties": {
+            "members": {"type": "array", "items": {"$ref": "#/definitions/person"}},
+            "cats": {"type": "array", "items": {"$ref": "#/definitions/cat"}},
+            "hedgehogs": {
+                "type": "array",
+                "items": {"$ref": "#/definitions/hedgehog"},
+            },
+            "otherPets": {"type": "array", "items": {"type": "string"}},
+            "presidentName": {"type": "string", "minLength": 1},
+        },
+        "required": ["members", "cats", "hedgehogs", "otherPets", "presidentName"],
+    },
+    "newsletter": {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string", "minLength": 1},
+            "topic": {"type": "string", "minLength": 1},
+            "sponsor": {"anyOf": [{"type": "null"}, {"type": "string"}]},
+            "issueNumber": {"anyOf": [{"type": "null"}, {"type": "integer"}]},
+            "tags": {
+                "anyOf": [
+                    {"type": "null"},
+                    {"type": "array", "items": {"type": "string"}},
+                ]
+            },
+            "featuredCats": {
+                "anyOf": [
+                    {"type": "null"},
+                    {"type": "array", "items": {"$ref": "#/definitions/cat"}},
+                ]
+            },
+            "featuredHedgehog": {
+                "anyOf": [{"type": "null"}, {"$ref": "#/definitions/hedgehog"}]
+            },
+            "featuredStaff": {
+                "anyOf": [
+                    {"type": "null"},
+                    {"type": "array", "items": {"$ref": "#/definitions/person"}},
+                ]
+            },
+        },
+        "required": ["title", "topic"],
+    },
+}
+
+# Compile every schema once at import time; validation then costs a single
+# call into the generated function instead of interpreted per-field checks
+if fastjsonschema is not None:
+    _VALIDATORS = {
+        name: fastjsonschema.compile(
+            {"$ref": f"#/definitions/{name}", "definitions": _SCHEMA_DEFINITIONS}
+        )
+        for name in _SCHEMA_DEFINITIONS
+    }
+else:
+    _VALIDATORS = {}
+
+
+def _compiled_validate(schema_name: str, data) -> bool:
+    """
+    Run the compiled validator for schema_name against data, if available.
+
+    Returns True when a compiled validator exists and the data passed it;
+    False when no compiled validator is available (caller falls back to the
+    hand-written checks). Schema violations are re-raised as AssertionError
+    so callers see the same failure type as the hand-written validators.
+    """
+    validator = _VALIDATORS.get(schema_name)
+    if validator is None:
+        return False
+    try:
+        validator(data)
+    except fastjsonschema.JsonSchemaException as error:
+        raise AssertionError(str(error)) from None
+    return True
+
+
+# Property-name constants, interned once at import so lookups in the
+# underlying content mapping can short-circuit on string identity instead of
+# comparing characters
+_P_NAME = sys.intern("name")
+_P_AGE = sys.intern("age")
+_P_CHILDREN = sys.intern("children")
+_P_PROFILE = sys.intern("profile")
+_P_YEARS = sys.intern("years")
+_P_MONTHS = sys.intern("months")
+_P_CATS = sys.intern("cats")
+
+# Property batches for the multi-field validators, bound at module scope so
+# each call reuses the same tuple of interned names
+_HEDGEHOG_PROPS = tuple(
+    sys.intern(name) for name in ("name", "age", "favoriteFood", "home", "hobbies")
+)
+_PET_CLUB_PROPS = tuple(
+    sys.intern(name)
+    for name in ("members", "cats", "hedgehogs", "otherPets", "presidentName")
+)
+_NEWSLETTER_PROPS = tuple(
+    sys.intern(name)
+    for name in (
+        "title",
+        "topic",
+        "sponsor",
+        "issueNumber",
+        "tags",
+        "featuredCats",
+        "featuredHedgehog",
+        "featuredStaff",
+    )
+)
+
+
+def _extract(content: fm.GeneratedContent, names: tuple) -> dict:
+    """
+    Fetch several properties from GeneratedContent in one pass.
+
+    An untyped value() call returns the content's whole underlying mapping,
+    so a batch of N properties costs one fetch plus a dict.get per name
+    instead of N full value() dispatches. Absent properties come back as
+    None, which is how the validators treat optional fields.
+    """
+    raw = content.value()
+    return {name: raw.get(name) for name in names}
+
+
+def _opt(content: fm.GeneratedContent, type_class, name: str):
+    """
+    Read an optional property from GeneratedContent without exception-driven
+    control flow.
+
+    A raw value() probe (no type conversion) is a dict lookup underneath, so
+    an absent field costs one hash lookup instead of an exception raise and
+    catch; only fields that are actually present go through the typed read.
+    """
+    if content.value(for_property=name) is None:
+        return None
+    return content.value(type_class, for_property=name)
+
+
+# Enum/constant constraints hoisted to module scope: built once, checked via
+# O(1) frozenset membership, and no per-call list allocation
+_VALID_FOODS = frozenset(("carrot", "turnip", "leek"))
+_HEDGEHOG_HOME = "a hedge"
+
+
+# Leaf types that pass through _generable_to_dict unchanged; checked by
+# exact type so each node costs one type() plus one hash instead of walking
+# an isinstance ladder
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Public dataclass fields per generable class, resolved once per class: the
+# field set is fixed by the @fm.generable decorator, so there is no need to
+# re-filter underscore names for every converted instance
+_PUBLIC_FIELDS: dict[type, tuple] = {}
+
 
 # Helper function to convert Generable to dict
 def _generable_to_dict(obj: Any) -> Any:
     """
     Convert a Generable object to a dict for validation.
     Handles nested Generable objects and lists.
+
+    Nodes dispatch on their exact type (generated data is plain JSON types,
+    so subclasses don't occur), and the traversal memoizes on object identity
+    for the duration of one call, so a Cat or Person referenced from several
+    places in the same tree is converted once instead of once per path, and
+    cyclic references can't recurse forever.
     """
-    if obj is None:
-        return None
-    elif isinstance(obj, (str, int, float, bool)):
-        return obj
-    elif isinstance(obj, list):
-        return [_generable_to_dict(item) for item in obj]
-    elif isinstance(obj, fm.Generable):
-        # It's a Generable object, convert to dict
-        result = {}
-        for key, value in obj.__dict__.items():
-            if not key.startswith("_"):
-                result[key] = _generable_to_dict(value)
-        return result
-    else:
+    memo: dict[int, Any] = {}
+
+    def convert(obj: Any) -> Any:
+        obj_type = type(obj)
+        if obj_type in _PASSTHROUGH_TYPES:
+            return obj
+        if obj_type is list:
+            key = id(obj)
+            if key in memo:
+                return memo[key]
+            result = []
+            # Register the container before recursing so cycles resolve to it
+            memo[key] = result
+            result.extend(convert(item) for item in obj)
+            return result
+        if isinstance(obj, fm.Generable):
+            key = id(obj)
+            if key in memo:
+                return memo[key]
+            # It's a Generable object, convert to dict. Walk the declared
+            # dataclass fields rather than __dict__: generable instances use
+            # __slots__ and have no per-instance dict
+            fields = _PUBLIC_FIELDS.get(obj_type)
+            if fields is None:
+                fields = tuple(
+                    name
+                    for name in obj_type.__dataclass_fields__
+                    if not name.startswith("_")
+                )
+                _PUBLIC_FIELDS[obj_type] = fields
+            result = {}
+            memo[key] = result
+            for field_name in fields:
+                result[field_name] = convert(getattr(obj, field_name))
+            return result
         return obj
 
+    return convert(obj)
+
 
 def validate_hedgehog(hedgehog_data) -> bool:
     """
@@ -42,25 +312,39 @@ def validate_hedgehog(hedgehog_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(hedgehog_data, tester_schemas.Hedgehog):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(hedgehog_data) is not dict and isinstance(
+        hedgehog_data, tester_schemas.Hedgehog
+    ):
         hedgehog_data = _generable_to_dict(hedgehog_data)
 
-    # Extract properties based on input type
-    if isinstance(hedgehog_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        name = hedgehog_data.value(str, for_property="name")
-        age = hedgehog_data.value(dict, for_property="age")
-        favoriteFood = hedgehog_data.value(str, for_property="favoriteFood")
-        home = hedgehog_data.value(str, for_property="home")
-        hobbies = hedgehog_data.value(List[str], for_property="hobbies")
-    elif isinstance(hedgehog_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(hedgehog_data) is dict and _compiled_validate("hedgehog", hedgehog_data):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(hedgehog_data) is dict:
         # Extract from dict
         name = hedgehog_data.get("name")
         age = hedgehog_data.get("age")
         favoriteFood = hedgehog_data.get("favoriteFood")
         home = hedgehog_data.get("home")
         hobbies = hedgehog_data.get("hobbies")
+    elif isinstance(hedgehog_data, fm.GeneratedContent):
+        # One batched read instead of five value() dispatches
+        vals = _extract(hedgehog_data, _HEDGEHOG_PROPS)
+        name = vals["name"]
+        age = vals["age"]
+        favoriteFood = vals["favoriteFood"]
+        home = vals["home"]
+        hobbies = vals["hobbies"]
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(hedgehog_data)}"
@@ -70,17 +354,26 @@ def validate_hedgehog(hedgehog_data) -> bool:
     assert isinstance(name, str), f"name must be string, got {type(name)}"
     assert len(name) > 0, "name must not be empty"
 
-    # Validate age structure and constraints
-    validate_age(age)
+    # Validate age structure and constraints. The common case after dict
+    # conversion — int years and months — passes with three exact-type
+    # checks; validate_age stays the slow path for GeneratedContent and
+    # malformed inputs
+    if not (
+        type(age) is dict
+        and type(age.get(_P_YEARS)) is int
+        and type(age.get(_P_MONTHS)) is int
+    ):
+        validate_age(age)
 
     # Validate favoriteFood enum constraint
-    valid_foods = ["carrot", "turnip", "leek"]
-    assert favoriteFood in valid_foods, (
-        f"favoriteFood must be one of {valid_foods}, got '{favoriteFood}'"
+    assert favoriteFood in _VALID_FOODS, (
+        f"favoriteFood must be one of {sorted(_VALID_FOODS)}, got '{favoriteFood}'"
     )
 
     # Validate home constant constraint
-    assert home == "a hedge", f"home must be 'a hedge', got '{home}'"
+    assert home == _HEDGEHOG_HOME, (
+        f"home must be '{_HEDGEHOG_HOME}', got '{home}'"
+    )
 
     # Validate hobbies array constraints
     assert isinstance(hobbies, list), f"hobbies must be list, got {type(hobbies)}"
@@ -93,38 +386,27 @@ def validate_hedgehog(hedgehog_data) -> bool:
     return True
 
 
-def validate_person(person_data) -> bool:
+def _validate_person_one(person_data) -> list:
     """
-    Validate person generated content.
-
-    Args:
-        person_data: Either a GeneratedContent object or a dict containing person data
-
-    Returns:
-        bool: True if validation passes
+    Validate one person's flat fields and return its children list.
 
-    Raises:
-        AssertionError: If any validation fails
+    This is the per-node half of person validation: it checks name, age, and
+    the shape of the children list, but does not descend into the children —
+    :func:`validate_person` drives the traversal with an explicit stack.
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(person_data, tester_schemas.Person):
-        person_data = _generable_to_dict(person_data)
-
-    # Extract properties based on input type
-    if isinstance(person_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        name = person_data.value(str, for_property="name")
-        # Age is optional, so we need to check if it exists
-        try:
-            age = person_data.value(int, for_property="age")
-        except (KeyError, AttributeError):
-            age = None
-        children = person_data.value(List[dict], for_property="children")
-    elif isinstance(person_data, dict):
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(person_data) is dict:
         # Extract from dict
         name = person_data.get("name")
         age = person_data.get("age")
         children = person_data.get("children")
+    elif isinstance(person_data, fm.GeneratedContent):
+        # Extract all required properties from GeneratedContent
+        name = person_data.value(str, for_property=_P_NAME)
+        # Age is optional, so probe for presence instead of catching
+        age = _opt(person_data, int, _P_AGE)
+        children = person_data.value(List[dict], for_property=_P_CHILDREN)
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(person_data)}"
@@ -146,8 +428,47 @@ def validate_person(person_data) -> bool:
     )
     for i, child in enumerate(children):
         assert isinstance(child, dict), f"children[{i}] must be dict, got {type(child)}"
-        # Recursively validate each child as a Person
-        validate_person(child)
+
+    return children
+
+
+def validate_person(person_data) -> bool:
+    """
+    Validate person generated content.
+
+    Args:
+        person_data: Either a GeneratedContent object or a dict containing person data
+
+    Returns:
+        bool: True if validation passes
+
+    Raises:
+        AssertionError: If any validation fails
+    """
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(person_data) is not dict and isinstance(
+        person_data, tester_schemas.Person
+    ):
+        person_data = _generable_to_dict(person_data)
+
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(person_data) is dict and _compiled_validate("person", person_data):
+        return True
+
+    # Walk the person tree with an explicit stack instead of self-recursion:
+    # each descendant costs one list operation rather than a full Python
+    # call frame, and deep child chains can't hit the recursion limit
+    stack = [person_data]
+    while stack:
+        children = _validate_person_one(stack.pop())
+        if _VALIDATE_DEEP:
+            stack.extend(children)
 
     return True
 
@@ -165,21 +486,34 @@ def validate_cat(cat_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(cat_data, tester_schemas.Cat):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(cat_data) is not dict and isinstance(
+        cat_data, tester_schemas.Cat
+    ):
         cat_data = _generable_to_dict(cat_data)
 
-    # Extract properties based on input type
-    if isinstance(cat_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        name = cat_data.value(str, for_property="name")
-        age = cat_data.value(dict, for_property="age")
-        profile = cat_data.value(str, for_property="profile")
-    elif isinstance(cat_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(cat_data) is dict and _compiled_validate("cat", cat_data):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(cat_data) is dict:
         # Extract from dict
         name = cat_data.get("name")
         age = cat_data.get("age")
         profile = cat_data.get("profile")
+    elif isinstance(cat_data, fm.GeneratedContent):
+        # Extract all required properties from GeneratedContent
+        name = cat_data.value(str, for_property=_P_NAME)
+        age = cat_data.value(dict, for_property=_P_AGE)
+        profile = cat_data.value(str, for_property=_P_PROFILE)
     else:
         raise AssertionError(f"Expected GeneratedContent or dict, got {type(cat_data)}")
 
@@ -187,8 +521,14 @@ def validate_cat(cat_data) -> bool:
     assert isinstance(name, str), f"name must be string, got {type(name)}"
     assert len(name) > 0, "name must not be empty"
 
-    # Validate age structure and constraints (required)
-    validate_age(age)
+    # Validate age structure and constraints (required); same dict-with-ints
+    # fast path as validate_hedgehog
+    if not (
+        type(age) is dict
+        and type(age.get(_P_YEARS)) is int
+        and type(age.get(_P_MONTHS)) is int
+    ):
+        validate_age(age)
 
     # Validate profile (required)
     assert isinstance(profile, str), f"profile must be string, got {type(profile)}"
@@ -210,19 +550,32 @@ def validate_age(age_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(age_data, tester_schemas.Age):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(age_data) is not dict and isinstance(
+        age_data, tester_schemas.Age
+    ):
         age_data = _generable_to_dict(age_data)
 
-    # Extract properties based on input type
-    if isinstance(age_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        years = age_data.value(int, for_property="years")
-        months = age_data.value(int, for_property="months")
-    elif isinstance(age_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(age_data) is dict and _compiled_validate("age", age_data):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(age_data) is dict:
         # Extract from dict
         years = age_data.get("years")
         months = age_data.get("months")
+    elif isinstance(age_data, fm.GeneratedContent):
+        # Extract all required properties from GeneratedContent
+        years = age_data.value(int, for_property=_P_YEARS)
+        months = age_data.value(int, for_property=_P_MONTHS)
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(age_data)}: {age_data}"
@@ -250,17 +603,30 @@ def validate_shelter(shelter_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(shelter_data, tester_schemas.Shelter):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(shelter_data) is not dict and isinstance(
+        shelter_data, tester_schemas.Shelter
+    ):
         shelter_data = _generable_to_dict(shelter_data)
 
-    # Extract properties based on input type
-    if isinstance(shelter_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        cats = shelter_data.value(List[dict], for_property="cats")
-    elif isinstance(shelter_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(shelter_data) is dict and _compiled_validate("shelter", shelter_data):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(shelter_data) is dict:
         # Extract from dict
         cats = shelter_data.get("cats")
+    elif isinstance(shelter_data, fm.GeneratedContent):
+        # Extract all required properties from GeneratedContent
+        cats = shelter_data.value(List[dict], for_property=_P_CATS)
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(shelter_data)}"
@@ -271,7 +637,8 @@ def validate_shelter(shelter_data) -> bool:
     for i, cat in enumerate(cats):
         assert isinstance(cat, dict), f"cats[{i}] must be dict, got {type(cat)}"
         # Recursively validate each cat
-        validate_cat(cat)
+        if _VALIDATE_DEEP:
+            validate_cat(cat)
 
     return True
 
@@ -289,59 +656,89 @@ def validate_pet_club(pet_club_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(pet_club_data, tester_schemas.PetClub):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(pet_club_data) is not dict and isinstance(
+        pet_club_data, tester_schemas.PetClub
+    ):
         pet_club_data = _generable_to_dict(pet_club_data)
 
-    # Extract properties based on input type
-    if isinstance(pet_club_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        members = pet_club_data.value(List[dict], for_property="members")
-        cats = pet_club_data.value(List[dict], for_property="cats")
-        hedgehogs = pet_club_data.value(List[dict], for_property="hedgehogs")
-        otherPets = pet_club_data.value(List[str], for_property="otherPets")
-        presidentName = pet_club_data.value(str, for_property="presidentName")
-    elif isinstance(pet_club_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(pet_club_data) is dict and _compiled_validate("pet_club", pet_club_data):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(pet_club_data) is dict:
         # Extract from dict
         members = pet_club_data.get("members")
         cats = pet_club_data.get("cats")
         hedgehogs = pet_club_data.get("hedgehogs")
         otherPets = pet_club_data.get("otherPets")
         presidentName = pet_club_data.get("presidentName")
+    elif isinstance(pet_club_data, fm.GeneratedContent):
+        # One batched read instead of five value() dispatches
+        vals = _extract(pet_club_data, _PET_CLUB_PROPS)
+        members = vals["members"]
+        cats = vals["cats"]
+        hedgehogs = vals["hedgehogs"]
+        otherPets = vals["otherPets"]
+        presidentName = vals["presidentName"]
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(pet_club_data)}"
         )
 
-    # Validate members (required)
+    # Local-bind the names the per-element loops below hit, turning each
+    # LOAD_GLOBAL (dict lookup) inside the loops into a LOAD_FAST (array
+    # index). Only loop-hot names are bound; once-per-call lookups stay global
+    _type = type
+    _dict = dict
+    _str = str
+    _validate_person = _validate_person_one
+    _validate_cat = validate_cat
+    _validate_hedgehog = validate_hedgehog
+
+    # Validate members (required). The element-type gate runs as one pass
+    # over the list up front, so the per-member validation below does no
+    # dict-check of its own
     assert isinstance(members, list), f"members must be list, got {type(members)}"
-    for i, member in enumerate(members):
-        assert isinstance(member, dict), (
-            f"members[{i}] must be dict, got {type(member)}"
-        )
-        # Recursively validate each member as a Person
-        validate_person(member)
+    assert all(_type(member) is _dict for member in members), (
+        "members must contain only dicts"
+    )
+    if _VALIDATE_DEEP:
+        # Feed the members into the shared person work stack directly
+        # instead of re-entering validate_person per member
+        stack = list(members)
+        while stack:
+            stack.extend(_validate_person(stack.pop()))
 
     # Validate cats (required)
     assert isinstance(cats, list), f"cats must be list, got {type(cats)}"
-    for i, cat in enumerate(cats):
-        assert isinstance(cat, dict), f"cats[{i}] must be dict, got {type(cat)}"
-        # Recursively validate each cat
-        validate_cat(cat)
+    assert all(_type(cat) is _dict for cat in cats), "cats must contain only dicts"
+    if _VALIDATE_DEEP:
+        for cat in cats:
+            _validate_cat(cat)
 
     # Validate hedgehogs (required)
     assert isinstance(hedgehogs, list), f"hedgehogs must be list, got {type(hedgehogs)}"
-    for i, hedgehog in enumerate(hedgehogs):
-        assert isinstance(hedgehog, dict), (
-            f"hedgehogs[{i}] must be dict, got {type(hedgehog)}"
-        )
-        # Recursively validate each hedgehog
-        validate_hedgehog(hedgehog)
+    assert all(_type(hedgehog) is _dict for hedgehog in hedgehogs), (
+        "hedgehogs must contain only dicts"
+    )
+    if _VALIDATE_DEEP:
+        for hedgehog in hedgehogs:
+            _validate_hedgehog(hedgehog)
 
     # Validate otherPets (required)
     assert isinstance(otherPets, list), f"otherPets must be list, got {type(otherPets)}"
-    for i, pet in enumerate(otherPets):
-        assert isinstance(pet, str), f"otherPets[{i}] must be string, got {type(pet)}"
+    assert all(_type(pet) is _str for pet in otherPets), (
+        "otherPets must contain only strings"
+    )
 
     # Validate presidentName (required)
     assert isinstance(presidentName, str), (
@@ -365,47 +762,27 @@ def validate_newsletter(newsletter_data) -> bool:
     Raises:
         AssertionError: If any validation fails
     """
-    # Convert Generable to dict for easier validation
-    if isinstance(newsletter_data, tester_schemas.ShelterNewsletter):
+    if not _VALIDATE:
+        return True
+
+    # Convert Generable to dict for easier validation; the recursive
+    # list paths always hand in plain dicts, so gate the conversion on
+    # exact type
+    if type(newsletter_data) is not dict and isinstance(
+        newsletter_data, tester_schemas.ShelterNewsletter
+    ):
         newsletter_data = _generable_to_dict(newsletter_data)
 
-    # Extract properties based on input type
-    if isinstance(newsletter_data, fm.GeneratedContent):
-        # Extract all required properties from GeneratedContent
-        title = newsletter_data.value(str, for_property="title")
-        topic = newsletter_data.value(str, for_property="topic")
-        # Optional fields
-        try:
-            sponsor = newsletter_data.value(str, for_property="sponsor")
-        except (KeyError, AttributeError):
-            sponsor = None
-        try:
-            issueNumber = newsletter_data.value(int, for_property="issueNumber")
-        except (KeyError, AttributeError):
-            issueNumber = None
-        try:
-            tags = newsletter_data.value(List[str], for_property="tags")
-        except (KeyError, AttributeError):
-            tags = None
-        try:
-            featuredCats = newsletter_data.value(
-                List[dict], for_property="featuredCats"
-            )
-        except (KeyError, AttributeError):
-            featuredCats = None
-        try:
-            featuredHedgehog = newsletter_data.value(
-                dict, for_property="featuredHedgehog"
-            )
-        except (KeyError, AttributeError):
-            featuredHedgehog = None
-        try:
-            featuredStaff = newsletter_data.value(
-                List[dict], for_property="featuredStaff"
-            )
-        except (KeyError, AttributeError):
-            featuredStaff = None
-    elif isinstance(newsletter_data, dict):
+    # Fast path: a single call into the compiled validator covers every
+    # check below
+    if type(newsletter_data) is dict and _compiled_validate(
+        "newsletter", newsletter_data
+    ):
+        return True
+
+    # Extract properties based on input type; plain dicts are the
+    # hot recursive case, so test them first by exact type
+    if type(newsletter_data) is dict:
         # Extract from dict
         title = newsletter_data.get("title")
         topic = newsletter_data.get("topic")
@@ -415,6 +792,18 @@ def validate_newsletter(newsletter_data) -> bool:
         featuredCats = newsletter_data.get("featuredCats")
         featuredHedgehog = newsletter_data.get("featuredHedgehog")
         featuredStaff = newsletter_data.get("featuredStaff")
+    elif isinstance(newsletter_data, fm.GeneratedContent):
+        # One batched read covers the required and the optional properties:
+        # absent optionals come back as None from the same pass
+        vals = _extract(newsletter_data, _NEWSLETTER_PROPS)
+        title = vals["title"]
+        topic = vals["topic"]
+        sponsor = vals["sponsor"]
+        issueNumber = vals["issueNumber"]
+        tags = vals["tags"]
+        featuredCats = vals["featuredCats"]
+        featuredHedgehog = vals["featuredHedgehog"]
+        featuredStaff = vals["featuredStaff"]
     else:
         raise AssertionError(
             f"Expected GeneratedContent or dict, got {type(newsletter_data)}"
@@ -438,23 +827,32 @@ def validate_newsletter(newsletter_data) -> bool:
             f"issueNumber must be int, got {type(issueNumber)}"
         )
 
+    # Local-bind the names the optional per-element loops below hit (see
+    # validate_pet_club); the scalar checks above run once and keep globals
+    _type = type
+    _dict = dict
+    _str = str
+    _validate_cat = validate_cat
+
     # Validate tags (optional)
     if tags is not None:
         assert isinstance(tags, list), f"tags must be list, got {type(tags)}"
-        for i, tag in enumerate(tags):
-            assert isinstance(tag, str), f"tags[{i}] must be string, got {type(tag)}"
+        assert all(_type(tag) is _str for tag in tags), (
+            "tags must contain only strings"
+        )
 
-    # Validate featuredCats (optional)
+    # Validate featuredCats (optional). One pass gates the element types,
+    # then the per-cat validation runs without a dict-check of its own
     if featuredCats is not None:
         assert isinstance(featuredCats, list), (
             f"featuredCats must be list, got {type(featuredCats)}"
         )
-        for i, cat in enumerate(featuredCats):
-            assert isinstance(cat, dict), (
-                f"featuredCats[{i}] must be dict, got {type(cat)}"
-            )
-            # Recursively validate each cat
-            validate_cat(cat)
+        assert all(_type(cat) is _dict for cat in featuredCats), (
+            "featuredCats must contain only dicts"
+        )
+        if _VALIDATE_DEEP:
+            for cat in featuredCats:
+                _validate_cat(cat)
 
     # Validate featuredHedgehog (optional)
     if featuredHedgehog is not None:
@@ -462,18 +860,22 @@ def validate_newsletter(newsletter_data) -> bool:
             f"featuredHedgehog must be dict, got {type(featuredHedgehog)}"
         )
         # Recursively validate the hedgehog
-        validate_hedgehog(featuredHedgehog)
+        if _VALIDATE_DEEP:
+            validate_hedgehog(featuredHedgehog)
 
     # Validate featuredStaff (optional)
     if featuredStaff is not None:
         assert isinstance(featuredStaff, list), (
             f"featuredStaff must be list, got {type(featuredStaff)}"
         )
-        for i, staff in enumerate(featuredStaff):
-            assert isinstance(staff, dict), (
-                f"featuredStaff[{i}] must be dict, got {type(staff)}"
-            )
-            # Recursively validate each staff member as a Person
-            validate_person(staff)
+        assert all(_type(staff) is _dict for staff in featuredStaff), (
+            "featuredStaff must contain only dicts"
+        )
+        if _VALIDATE_DEEP:
+            # Feed the staff into the shared person work stack directly
+            _validate_person = _validate_person_one
+            stack = list(featuredStaff)
+            while stack:
+                stack.extend(_validate_person(stack.pop()))
 
     return True
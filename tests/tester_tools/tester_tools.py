@@ -3,8 +3,101 @@
 
 import asyncio
 import json
+import operator
+import sys
 import apple_fm_sdk as fm
 
+# Argument-name constants, interned once at import so the per-call lookups in
+# GeneratedContent's mapping can short-circuit on string identity
+_P_OPERATION = sys.intern("operation")
+_P_A = sys.intern("a")
+_P_B = sys.intern("b")
+_P_USER_ID = sys.intern("user_id")
+_P_ITEMS = sys.intern("items")
+_P_ACTION = sys.intern("action")
+_P_REQUIRED_PARAM = sys.intern("required_param")
+_P_OPTIONAL_PARAM = sys.intern("optional_param")
+_P_SHOULD_FAIL = sys.intern("should_fail")
+_P_DELAY = sys.intern("delay")
+_P_MESSAGE = sys.intern("message")
+
+
+def _compile_reader(spec):
+    """
+    Compile an argument-reader closure for a tool's parameter list.
+
+    ``spec`` is a sequence of ``(type, property_name)`` pairs. The returned
+    function takes a GeneratedContent and returns the argument values as a
+    tuple, with every ``args.value(...)`` call baked into one generated
+    function body — so each tool invocation runs a single straight-line
+    bytecode sequence instead of re-interpreting the parameter list.
+    """
+    namespace = {}
+    calls = []
+    for index, (value_type, prop) in enumerate(spec):
+        prop_ref = f"_prop{index}"
+        namespace[prop_ref] = prop
+        # The parameter types are all builtins, so the bare name resolves
+        # through the exec namespace's __builtins__
+        calls.append(f"args.value({value_type.__name__}, for_property={prop_ref})")
+    source = f"def read(args):\n    return ({', '.join(calls)},)"
+    exec(compile(source, "<tool-reader>", "exec"), namespace)
+    # staticmethod so class-body assignment doesn't turn the closure into a
+    # bound method expecting self
+    return staticmethod(namespace["read"])
+
+
+# Calculator dispatch table: one hash lookup instead of walking an if/elif
+# chain, and the operator functions are C-implemented so each call skips a
+# Python frame
+_CALC_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+# Mock user database, serialized once at import: the dicts are constant, so
+# there is no reason to re-walk and re-escape them with json.dumps on every
+# tool invocation. Serializing from the dicts (rather than hand-writing the
+# JSON) keeps the exact json.dumps formatting the tests assert against.
+_USERS_JSON = {
+    user_id: json.dumps(user)
+    for user_id, user in {
+        1: {"name": "Alice", "email": "alice@example.com", "role": "admin"},
+        2: {"name": "Bob", "email": "bob@example.com", "role": "user"},
+        3: {"name": "Charlie", "email": "charlie@example.com", "role": "user"},
+    }.items()
+}
+
+
+def _list_count(items: list) -> str:
+    return f"The list has {len(items)} items"
+
+
+def _list_sum(items: list) -> str:
+    # sum() is already a single C-level loop; math.fsum is deliberately not
+    # used because it would float-ify integer totals and change the output
+    try:
+        return f"The sum is {sum(items)}"
+    except TypeError:
+        return "Error: Cannot sum non-numeric items"
+
+
+def _list_join(items: list) -> str:
+    # The schema declares items as list[str], so join the list directly in
+    # that common case — no generator frame, no per-element str() call — and
+    # only fall back to stringifying for mixed payloads
+    try:
+        return f"Joined: {', '.join(items)}"
+    except TypeError:
+        return f"Joined: {', '.join(str(item) for item in items)}"
+
+
+# Action dispatch table for ProcessListTool, mirroring the calculator table
+_LIST_ACTIONS = {"count": _list_count, "sum": _list_sum, "join": _list_join}
+
+
 # =============================================================================
 # Test Parameter Schemas
 # =============================================================================
@@ -58,27 +151,28 @@ class SimpleCalculatorTool(fm.Tool):
     name = "simple_calculator"
     description = "Perform basic arithmetic operations"
 
+    # Schema is shared across instances: tests build batches of identical
+    # calculator tools, and without this cache each construction would build
+    # (and bridge) a fresh GenerationSchema from the same params class.
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return CalculatorParams.generation_schema()
+        if SimpleCalculatorTool._schema is None:
+            SimpleCalculatorTool._schema = CalculatorParams.generation_schema()
+        return SimpleCalculatorTool._schema
+
+    _read = _compile_reader([(str, _P_OPERATION), (float, _P_A), (float, _P_B)])
 
     async def call(self, args: fm.GeneratedContent) -> str:
-        operation = args.value(str, for_property="operation")
-        a = args.value(float, for_property="a")
-        b = args.value(float, for_property="b")
-
-        if operation == "add":
-            result = a + b
-        elif operation == "subtract":
-            result = a - b
-        elif operation == "multiply":
-            result = a * b
-        elif operation == "divide":
-            if b == 0:
-                return "Error: Division by zero"
-            result = a / b
-        else:
+        operation, a, b = self._read(args)
+
+        op = _CALC_OPS.get(operation)
+        if op is None:
             return f"Error: Unknown operation {operation}"
+        if operation == "divide" and b == 0:
+            return "Error: Division by zero"
+        result = op(a, b)
 
         return f"The result of {a} {operation} {b} is {result}"
 
@@ -89,25 +183,24 @@ class GetUserInfoTool(fm.Tool):
     name = "get_user_info"
     description = "Get information about a user by ID"
 
+    # Schema is shared across instances (see SimpleCalculatorTool)
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return UserInfoParams.generation_schema()
+        if GetUserInfoTool._schema is None:
+            GetUserInfoTool._schema = UserInfoParams.generation_schema()
+        return GetUserInfoTool._schema
 
-    async def call(self, args: fm.GeneratedContent) -> str:
-        user_id = args.value(int, for_property="user_id")
+    _read = _compile_reader([(int, _P_USER_ID)])
 
-        # Mock database
-        users = {
-            1: {"name": "Alice", "email": "alice@example.com", "role": "admin"},
-            2: {"name": "Bob", "email": "bob@example.com", "role": "user"},
-            3: {"name": "Charlie", "email": "charlie@example.com", "role": "user"},
-        }
+    async def call(self, args: fm.GeneratedContent) -> str:
+        (user_id,) = self._read(args)
 
-        user = users.get(user_id)
-        if user:
-            return json.dumps(user)
-        else:
-            return f"Error: User {user_id} not found"
+        user_json = _USERS_JSON.get(user_id)
+        if user_json is not None:
+            return user_json
+        return f"Error: User {user_id} not found"
 
 
 class ProcessListTool(fm.Tool):
@@ -116,26 +209,24 @@ class ProcessListTool(fm.Tool):
     name = "process_list"
     description = "Process a list of items"
 
+    # Schema is shared across instances (see SimpleCalculatorTool)
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return ListProcessParams.generation_schema()
+        if ProcessListTool._schema is None:
+            ProcessListTool._schema = ListProcessParams.generation_schema()
+        return ProcessListTool._schema
+
+    _read = _compile_reader([(list, _P_ITEMS), (str, _P_ACTION)])
 
     async def call(self, args: fm.GeneratedContent) -> str:
-        items = args.value(list, for_property="items")
-        action = args.value(str, for_property="action")
-
-        if action == "count":
-            return f"The list has {len(items)} items"
-        elif action == "sum":
-            try:
-                total = sum(items)
-                return f"The sum is {total}"
-            except TypeError:
-                return "Error: Cannot sum non-numeric items"
-        elif action == "join":
-            return f"Joined: {', '.join(str(item) for item in items)}"
-        else:
+        items, action = self._read(args)
+
+        handler = _LIST_ACTIONS.get(action)
+        if handler is None:
             return f"Error: Unknown action {action}"
+        return handler(items)
 
 
 class OptionalParamsTool(fm.Tool):
@@ -144,16 +235,26 @@ class OptionalParamsTool(fm.Tool):
     name = "optional_params_tool"
     description = "Tool with optional parameters"
 
+    # Schema is shared across instances (see SimpleCalculatorTool)
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return OptionalParams.generation_schema()
+        if OptionalParamsTool._schema is None:
+            OptionalParamsTool._schema = OptionalParams.generation_schema()
+        return OptionalParamsTool._schema
+
+    # Only the required parameter goes through the compiled reader; the
+    # optional one needs the try/except below, which a straight-line reader
+    # can't express
+    _read = _compile_reader([(str, _P_REQUIRED_PARAM)])
 
     async def call(self, args: fm.GeneratedContent) -> str:
-        required_param = args.value(str, for_property="required_param")
+        (required_param,) = self._read(args)
 
         # Try to get optional parameter
         try:
-            optional_param = args.value(str, for_property="optional_param")
+            optional_param = args.value(str, for_property=_P_OPTIONAL_PARAM)
         except Exception:
             optional_param = "default_value"
 
@@ -166,12 +267,19 @@ class ErrorRaisingTool(fm.Tool):
     name = "error_raising_tool"
     description = "Tool that can raise errors for testing"
 
+    # Schema is shared across instances (see SimpleCalculatorTool)
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return ErrorParams.generation_schema()
+        if ErrorRaisingTool._schema is None:
+            ErrorRaisingTool._schema = ErrorParams.generation_schema()
+        return ErrorRaisingTool._schema
+
+    _read = _compile_reader([(bool, _P_SHOULD_FAIL)])
 
     async def call(self, args: fm.GeneratedContent) -> str:
-        should_fail = args.value(bool, for_property="should_fail")
+        (should_fail,) = self._read(args)
 
         if should_fail:
             raise ValueError("Intentional error for testing")
@@ -185,13 +293,19 @@ class AsyncDelayTool(fm.Tool):
     name = "async_delay_tool"
     description = "Tool with async delay"
 
+    # Schema is shared across instances (see SimpleCalculatorTool)
+    _schema = None
+
     @property
     def arguments_schema(self) -> fm.GenerationSchema:
-        return DelayParams.generation_schema()
+        if AsyncDelayTool._schema is None:
+            AsyncDelayTool._schema = DelayParams.generation_schema()
+        return AsyncDelayTool._schema
+
+    _read = _compile_reader([(float, _P_DELAY), (str, _P_MESSAGE)])
 
     async def call(self, args: fm.GeneratedContent) -> str:
-        delay = args.value(float, for_property="delay")
-        message = args.value(str, for_property="message")
+        delay, message = self._read(args)
 
         await asyncio.sleep(delay)
         return f"After {delay}s delay: {message}"